@@ -6,14 +6,18 @@
 import torch
 import torch.nn as nn
 from torchvision import models
+from typing import List
 
 
 class VGG19(nn.Module):
 
+    BLOCKS_NUM = 5
+
     def __init__(self, pretrained=True):
         super().__init__()
 
-        vgg19_pretrained = models.vgg19(pretrained=True)
+        # Without pretrained, the architecture only (e.g. to load a saved state dict into).
+        vgg19_pretrained = models.vgg19(pretrained=True) if pretrained else models.vgg19()
         backbone = vgg19_pretrained.features
 
         self.avgpool = vgg19_pretrained.avgpool
@@ -60,3 +64,56 @@ class VGG19(nn.Module):
         x = self.classifier(x)
 
         return x
+
+    def get_stages(self, depth=BLOCKS_NUM):
+        """
+        Flat layers of the forward pass up to block #depth, split into stages.
+        Stage #i ends with the last layer of block #i, so the forward stops
+        right after the deepest block and never reaches pool5 / classifier.
+        """
+        assert 1 <= depth <= self.BLOCKS_NUM
+
+        stages = []
+        for i in range(1, depth + 1):
+            stage = []
+            if i > 1:
+                stage.append(nn.ReLU())
+                stage.append(self.__getattr__(f"pool{i - 1}"))
+            stage.extend(self.__getattr__(f"block{i}"))
+            stages.append(stage)
+        return stages
+
+    def get_truncated(self, depth=BLOCKS_NUM):
+        """
+        Truncated network, which shares layers (and hooks) with the full one.
+        """
+        return nn.Sequential(*[layer for stage in self.get_stages(depth) for layer in stage]).eval()
+
+
+class VGG19Features(nn.Module):
+    """
+    Hook-free multi-output extractor upon the stages of a VGG19 (sharing
+    its layers): returns the output of every block of block_ids (sorted
+    ascending, taken before ReLU as the hooks see it), or its per-channel
+    ReLU mean (in float32) with pooled=True. It can be scripted
+    (TorchScript) or compiled (torch.compile).
+    """
+
+    def __init__(self, model, block_ids, pooled=True):
+        super().__init__()
+
+        block_ids = sorted(set(int(block_id) for block_id in block_ids))
+        self.stages = nn.ModuleList([nn.Sequential(*stage) for stage in model.get_stages(block_ids[-1])])
+        self.keep: List[bool] = [(i + 1) in block_ids for i in range(len(self.stages))]
+        self.pooled = pooled
+
+    def forward(self, x) -> List[torch.Tensor]:
+        outputs: List[torch.Tensor] = []
+        for i, stage in enumerate(self.stages):
+            x = stage(x)
+            if self.keep[i]:
+                if self.pooled:
+                    outputs.append(torch.relu(x.float()).mean(dim=(2, 3)))
+                else:
+                    outputs.append(x)
+        return outputs
@@ -0,0 +1,91 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import warnings
+
+import torch
+import torch.nn as nn
+from torch.ao.quantization import QuantStub
+from torch.ao.quantization import get_default_qconfig
+from torch.ao.quantization import fuse_modules
+from torch.ao.quantization import prepare
+from torch.ao.quantization import convert
+
+from models.vgg19 import VGG19
+
+
+class VGG19Int8(VGG19):
+    """
+    Post-training static int8 quantization (eager mode, fbgemm / qnnpack)
+    of the VGG19 feature blocks. The classifier is dropped, so only the
+    truncated forward (see VGG19.get_truncated) is available.
+
+    Inner Conv + ReLU pairs of every block are fused; the last convolution
+    of a block stays un-fused, since it is the hooked one and its output is
+    taken before ReLU. Hooked outputs are quantized tensors.
+
+    Usage: VGG19Int8() -> calibrate(batches) -> convert(), or load(path).
+    """
+
+    QUANTIZED = True
+
+    def __init__(self, backend='fbgemm', pretrained=True):
+        super().__init__(pretrained=pretrained)
+        del self.avgpool
+        del self.classifier
+
+        self.backend = backend
+        torch.backends.quantized.engine = backend
+
+        self.quant = QuantStub()
+        for i in range(1, self.BLOCKS_NUM + 1):
+            # Sliced blocks keep the names of the backbone layers.
+            names, layers = zip(*self.__getattr__(f"block{i}").named_children())
+            fuse_modules(self.__getattr__(f"block{i}"),
+                         [[names[j], names[j + 1]] for j in range(len(layers) - 1)
+                          if isinstance(layers[j], nn.Conv2d) and isinstance(layers[j + 1], nn.ReLU)],
+                         inplace=True)
+
+        self.eval()
+        self.qconfig = get_default_qconfig(backend)
+        prepare(self, inplace=True)
+        self.converted = False
+
+    def forward(self, x):
+        return self.get_truncated(self.BLOCKS_NUM)(x)
+
+    def get_stages(self, depth=VGG19.BLOCKS_NUM):
+        stages = super().get_stages(depth)
+        stages[0].insert(0, self.quant)
+        return stages
+
+    def calibrate(self, batches):
+        """
+        Feeds float batches through the observers (before convert).
+        """
+        assert not self.converted
+        with torch.inference_mode():
+            for batch_t in batches:
+                self(batch_t)
+
+    def convert(self):
+        convert(self, inplace=True)
+        self.converted = True
+        return self
+
+    def save(self, path):
+        assert self.converted
+        torch.save({'backend': self.backend, 'state_dict': self.state_dict()}, path)
+
+    @classmethod
+    def load(cls, path):
+        checkpoint = torch.load(path)
+        # The state dict holds all the weights & quantization parameters, so neither float weights
+        # nor calibration are needed: converting the empty observers only warns about that.
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', message='.*must run observer.*')
+            model = cls(backend=checkpoint['backend'], pretrained=False).convert()
+        model.load_state_dict(checkpoint['state_dict'])
+        return model.eval()
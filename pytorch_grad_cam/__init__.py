@@ -1,14 +1,39 @@
-from pytorch_grad_cam.grad_cam import GradCAM
-from pytorch_grad_cam.ablation_layer import AblationLayer, AblationLayerVit, AblationLayerFasterRCNN
-from pytorch_grad_cam.ablation_cam import AblationCAM
-from pytorch_grad_cam.xgrad_cam import XGradCAM
-from pytorch_grad_cam.grad_cam_plusplus import GradCAMPlusPlus
-from pytorch_grad_cam.score_cam import ScoreCAM
-from pytorch_grad_cam.layer_cam import LayerCAM
-from pytorch_grad_cam.eigen_cam import EigenCAM
-from pytorch_grad_cam.eigen_grad_cam import EigenGradCAM
-from pytorch_grad_cam.fullgrad_cam import FullGrad
-from pytorch_grad_cam.guided_backprop import GuidedBackpropReLUModel
-from pytorch_grad_cam.activations_and_gradients import ActivationsAndGradients
-import pytorch_grad_cam.utils.model_targets
-import pytorch_grad_cam.utils.reshape_transforms
\ No newline at end of file
+import importlib
+
+# Names are resolved on first access (PEP 562), so that importing a single
+# submodule (e.g. activations_extractor) does not pull in ttach, cv2 and
+# torchvision through every CAM method.
+_LAZY_ATTRS = {
+    'GradCAM': 'pytorch_grad_cam.grad_cam',
+    'AblationLayer': 'pytorch_grad_cam.ablation_layer',
+    'AblationLayerVit': 'pytorch_grad_cam.ablation_layer',
+    'AblationLayerFasterRCNN': 'pytorch_grad_cam.ablation_layer',
+    'AblationCAM': 'pytorch_grad_cam.ablation_cam',
+    'XGradCAM': 'pytorch_grad_cam.xgrad_cam',
+    'GradCAMPlusPlus': 'pytorch_grad_cam.grad_cam_plusplus',
+    'ScoreCAM': 'pytorch_grad_cam.score_cam',
+    'LayerCAM': 'pytorch_grad_cam.layer_cam',
+    'EigenCAM': 'pytorch_grad_cam.eigen_cam',
+    'EigenGradCAM': 'pytorch_grad_cam.eigen_grad_cam',
+    'FullGrad': 'pytorch_grad_cam.fullgrad_cam',
+    'GuidedBackpropReLUModel': 'pytorch_grad_cam.guided_backprop',
+    'ActivationsAndGradients': 'pytorch_grad_cam.activations_and_gradients',
+    'ActivationsExtractor': 'pytorch_grad_cam.activations_extractor',
+}
+
+__all__ = list(_LAZY_ATTRS) + ['utils']
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    elif name == 'utils':
+        value = importlib.import_module('pytorch_grad_cam.utils')
+    else:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -17,7 +17,8 @@ class ActivationsAndGradients:
                 target_layer.register_forward_hook(self.save_gradient))
 
     def save_activation(self, module, input, output):
-        activation = output
+        # Reduced-precision (autocast) activations are cast back to float32.
+        activation = output.float()
         
         if self.reshape_transform is not None:
             activation = self.reshape_transform(activation)
@@ -30,6 +31,7 @@ class ActivationsAndGradients:
 
         # Gradients are computed in reverse order
         def _store_grad(grad):
+            grad = grad.float()
             if self.reshape_transform is not None:
                 grad = self.reshape_transform(grad)
             self.gradients = [grad.cpu().detach()] + self.gradients
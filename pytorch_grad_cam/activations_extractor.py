@@ -0,0 +1,84 @@
+import numpy as np
+import torch
+from typing import Callable, List, Tuple
+from pytorch_grad_cam.utils.precision import get_autocast, to_memory_format
+
+
+class ActivationsExtractor:
+    """ Class for extracting activations from targetted intermediate layers
+        without gradients: no gradient hooks, no backward pass and no
+        retained autograd graph (the forward runs under inference_mode).
+        Mirrors the BaseCAM call convention, returning an empty grads list.
+        With reduce, a callable mapping the [B, C, H, W] activation to a
+        smaller tensor (e.g. per-channel statistics), every hook keeps only
+        its result, computed on the model's device, instead of a copy of the
+        full map.
+        precision='bf16' runs the forward under autocast, channels_last
+        switches the memory format; activations are cast back to float32
+        before any reduction. """
+
+    def __init__(self,
+                 model: torch.nn.Module,
+                 target_layers: List[torch.nn.Module],
+                 use_cuda: bool = False,
+                 reshape_transform: Callable = None,
+                 reduce: Callable = None,
+                 precision: str = 'fp32',
+                 channels_last: bool = False) -> None:
+        self.model = model.eval()
+        self.target_layers = target_layers
+        self.cuda = use_cuda
+        if self.cuda:
+            self.model = model.cuda()
+        self.precision = precision
+        self.channels_last = channels_last
+        self.model = to_memory_format(self.model, self.channels_last)
+        self.reshape_transform = reshape_transform
+        self.reduce = reduce
+        self.activations = []
+        self.handles = []
+        for target_layer in target_layers:
+            self.handles.append(
+                target_layer.register_forward_hook(self.save_activation))
+
+    def save_activation(self, module, input, output):
+        # Reduced-precision / quantized activations are reduced in float32.
+        activation = output.dequantize() if output.is_quantized else output.float()
+
+        if self.reshape_transform is not None:
+            activation = self.reshape_transform(activation)
+        if self.reduce is not None:
+            activation = self.reduce(activation)
+        self.activations.append(activation.cpu())
+
+    def forward(self,
+                input_tensor: torch.Tensor,
+                targets: List[torch.nn.Module] = None) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        if self.cuda:
+            input_tensor = input_tensor.cuda()
+        input_tensor = to_memory_format(input_tensor, self.channels_last)
+
+        self.activations = []
+        with torch.inference_mode(), get_autocast(self.precision, self.cuda):
+            self.model(input_tensor)
+
+        activations_list = [a.numpy() for a in self.activations]
+        return activations_list, []
+
+    def __call__(self,
+                 input_tensor: torch.Tensor,
+                 targets: List[torch.nn.Module] = None) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        return self.forward(input_tensor, targets)
+
+    def release(self):
+        for handle in self.handles:
+            handle.remove()
+
+    def __del__(self):
+        self.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.release()
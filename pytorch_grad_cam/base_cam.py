@@ -6,6 +6,7 @@ from pytorch_grad_cam.activations_and_gradients import ActivationsAndGradients
 from pytorch_grad_cam.utils.svd_on_activations import get_2d_projection
 from pytorch_grad_cam.utils.image import scale_cam_image
 from pytorch_grad_cam.utils.model_targets import ClassifierOutputTarget
+from pytorch_grad_cam.utils.precision import get_autocast, to_memory_format
 
 
 class BaseCAM:
@@ -15,12 +16,17 @@ class BaseCAM:
                  use_cuda: bool = False,
                  reshape_transform: Callable = None,
                  compute_input_gradient: bool = False,
-                 uses_gradients: bool = True) -> None:
+                 uses_gradients: bool = True,
+                 precision: str = 'fp32',
+                 channels_last: bool = False) -> None:
         self.model = model.eval()
         self.target_layers = target_layers
         self.cuda = use_cuda
         if self.cuda:
             self.model = model.cuda()
+        self.precision = precision
+        self.channels_last = channels_last
+        self.model = to_memory_format(self.model, self.channels_last)
         self.reshape_transform = reshape_transform
         self.compute_input_gradient = compute_input_gradient
         self.uses_gradients = uses_gradients
@@ -66,12 +72,15 @@ class BaseCAM:
 
         if self.cuda:
             input_tensor = input_tensor.cuda()
+        input_tensor = to_memory_format(input_tensor, self.channels_last)
 
         if self.compute_input_gradient:
             input_tensor = torch.autograd.Variable(input_tensor,
                                                    requires_grad=True)
 
-        outputs = self.activations_and_grads(input_tensor)
+        with get_autocast(self.precision, self.cuda):
+            outputs = self.activations_and_grads(input_tensor)
+        outputs = outputs.float()
         if targets is None:
             target_categories = np.argmax(outputs.cpu().data.numpy(), axis=-1)
             targets = [ClassifierOutputTarget(category) for category in target_categories]
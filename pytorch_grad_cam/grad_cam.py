@@ -4,14 +4,16 @@ from pytorch_grad_cam.base_cam import BaseCAM
 
 class GradCAM(BaseCAM):
     def __init__(self, model, target_layers, use_cuda=False,
-                 reshape_transform=None):
+                 reshape_transform=None, precision='fp32', channels_last=False):
         super(
             GradCAM,
             self).__init__(
             model,
             target_layers,
             use_cuda,
-            reshape_transform)
+            reshape_transform,
+            precision=precision,
+            channels_last=channels_last)
 
     def get_cam_weights(self,
                         input_tensor,
@@ -1,4 +1,25 @@
-from pytorch_grad_cam.utils.image import deprocess_image
-from pytorch_grad_cam.utils.svd_on_activations import get_2d_projection
-from pytorch_grad_cam.utils import model_targets
-from pytorch_grad_cam.utils import reshape_transforms
\ No newline at end of file
+import importlib
+
+# Resolved on first access (PEP 562): precision helpers must not pull in cv2.
+_LAZY_ATTRS = {
+    'deprocess_image': 'pytorch_grad_cam.utils.image',
+    'get_2d_projection': 'pytorch_grad_cam.utils.svd_on_activations',
+}
+_LAZY_MODULES = ['model_targets', 'reshape_transforms']
+
+__all__ = list(_LAZY_ATTRS) + _LAZY_MODULES
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module('pytorch_grad_cam.utils.' + name)
+    else:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
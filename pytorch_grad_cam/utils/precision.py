@@ -0,0 +1,25 @@
+import torch
+
+PRECISIONS = {
+    'fp32': None,
+    'bf16': torch.bfloat16
+}
+
+
+def get_autocast(precision: str = 'fp32', use_cuda: bool = False):
+    """ Autocast context of the inference precision (a no-op for fp32).
+        Convolutions and matmuls run in the reduced dtype, reductions
+        and the rest stay in float32. """
+    dtype = PRECISIONS[precision]
+    return torch.autocast(device_type='cuda' if use_cuda else 'cpu',
+                          dtype=torch.bfloat16 if dtype is None else dtype,
+                          enabled=dtype is not None)
+
+
+def to_memory_format(x, channels_last: bool = False):
+    """ Converts a module or a 4D tensor to channels_last, if requested. """
+    if not channels_last:
+        return x
+    if isinstance(x, torch.nn.Module):
+        return x.to(memory_format=torch.channels_last)
+    return x.contiguous(memory_format=torch.channels_last)
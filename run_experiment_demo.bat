@@ -1,20 +1,8 @@
-python scale_estimation.py --image "../GradCam/hamster.jpg" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "../GradCam/hamster.jpg" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "../GradCam/hamster.jpg" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "../GradCam/hamster.jpg" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "../GradCam/hamster.jpg" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "../GradCam/hamster.jpg" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "../GradCam/hamster.jpg"
 
-python scale_estimation.py --image "../GradCam/dog.jpg" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "../GradCam/dog.jpg" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "../GradCam/dog.jpg" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "../GradCam/dog.jpg" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "../GradCam/dog.jpg" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "../GradCam/dog.jpg" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "../GradCam/dog.jpg" 
 
-python scale_estimation.py --image "../GradCam/leopard.jpg" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "../GradCam/leopard.jpg" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "../GradCam/leopard.jpg" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "../GradCam/leopard.jpg" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "../GradCam/leopard.jpg" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "../GradCam/leopard.jpg" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "../GradCam/leopard.jpg" 
\ No newline at end of file
@@ -1,839 +1,359 @@
-python scale_estimation.py --image "E:/image-net/accordion.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/accordion.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/accordion.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/accordion.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/accordion.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/accordion.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "accordion.png"
 
-python scale_estimation.py --image "E:/image-net/affenpinscher.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/affenpinscher.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/affenpinscher.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/affenpinscher.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/affenpinscher.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/affenpinscher.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "affenpinscher.png"
 
-python scale_estimation.py --image "E:/image-net/analog-clock.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/analog-clock.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/analog-clock.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/analog-clock.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/analog-clock.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/analog-clock.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "analog-clock.png"
 
-python scale_estimation.py --image "E:/image-net/armadillo.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/armadillo.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/armadillo.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/armadillo.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/armadillo.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/armadillo.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "armadillo.png"
 
-python scale_estimation.py --image "E:/image-net/baboon.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/baboon.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/baboon.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/baboon.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/baboon.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/baboon.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "baboon.png"
 
-python scale_estimation.py --image "E:/image-net/barn-spider.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/barn-spider.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/barn-spider.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/barn-spider.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/barn-spider.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/barn-spider.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "barn-spider.png"
 
-python scale_estimation.py --image "E:/image-net/bathtub.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/bathtub.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/bathtub.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/bathtub.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/bathtub.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/bathtub.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "bathtub.png"
 
-python scale_estimation.py --image "E:/image-net/beagle.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/beagle.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/beagle.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/beagle.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/beagle.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/beagle.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "beagle.png"
 
-python scale_estimation.py --image "E:/image-net/bee.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/bee.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/bee.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/bee.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/bee.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/bee.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "bee.png"
 
-python scale_estimation.py --image "E:/image-net/binoculars.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/binoculars.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/binoculars.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/binoculars.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/binoculars.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/binoculars.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "binoculars.png"
 
-python scale_estimation.py --image "E:/image-net/black-and-gold-garden-spider.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/black-and-gold-garden-spider.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/black-and-gold-garden-spider.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/black-and-gold-garden-spider.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/black-and-gold-garden-spider.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/black-and-gold-garden-spider.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "black-and-gold-garden-spider.png"
 
-python scale_estimation.py --image "E:/image-net/black-swan.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/black-swan.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/black-swan.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/black-swan.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/black-swan.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/black-swan.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "black-swan.png"
 
-python scale_estimation.py --image "E:/image-net/black-widow.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/black-widow.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/black-widow.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/black-widow.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/black-widow.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/black-widow.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "black-widow.png"
 
-python scale_estimation.py --image "E:/image-net/bolo-tie.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/bolo-tie.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/bolo-tie.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/bolo-tie.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/bolo-tie.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/bolo-tie.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "bolo-tie.png"
 
-python scale_estimation.py --image "E:/image-net/bonnet.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/bonnet.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/bonnet.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/bonnet.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/bonnet.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/bonnet.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "bonnet.png"
 
-python scale_estimation.py --image "E:/image-net/brassiere.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/brassiere.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/brassiere.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/brassiere.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/brassiere.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/brassiere.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "brassiere.png"
 
-python scale_estimation.py --image "E:/image-net/broccoli.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/broccoli.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/broccoli.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/broccoli.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/broccoli.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/broccoli.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "broccoli.png"
 
-python scale_estimation.py --image "E:/image-net/buckeye.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/buckeye.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/buckeye.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/buckeye.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/buckeye.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/buckeye.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "buckeye.png"
 
-python scale_estimation.py --image "E:/image-net/buckle.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/buckle.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/buckle.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/buckle.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/buckle.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/buckle.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "buckle.png"
 
-python scale_estimation.py --image "E:/image-net/bull-mastiff.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/bull-mastiff.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/bull-mastiff.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/bull-mastiff.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/bull-mastiff.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/bull-mastiff.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "bull-mastiff.png"
 
-python scale_estimation.py --image "E:/image-net/cabbage-butterfly.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/cabbage-butterfly.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/cabbage-butterfly.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/cabbage-butterfly.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/cabbage-butterfly.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/cabbage-butterfly.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "cabbage-butterfly.png"
 
-python scale_estimation.py --image "E:/image-net/capuchin.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/capuchin.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/capuchin.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/capuchin.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/capuchin.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/capuchin.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "capuchin.png"
 
-python scale_estimation.py --image "E:/image-net/cardoon.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/cardoon.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/cardoon.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/cardoon.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/cardoon.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/cardoon.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "cardoon.png"
 
-python scale_estimation.py --image "E:/image-net/cash-machine.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/cash-machine.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/cash-machine.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/cash-machine.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/cash-machine.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/cash-machine.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "cash-machine.png"
 
-python scale_estimation.py --image "E:/image-net/castle.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/castle.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/castle.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/castle.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/castle.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/castle.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "castle.png"
 
-python scale_estimation.py --image "E:/image-net/cauliflower.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/cauliflower.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/cauliflower.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/cauliflower.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/cauliflower.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/cauliflower.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "cauliflower.png"
 
-python scale_estimation.py --image "E:/image-net/chainlink-fence.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/chainlink-fence.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/chainlink-fence.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/chainlink-fence.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/chainlink-fence.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/chainlink-fence.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "chainlink-fence.png"
 
-python scale_estimation.py --image "E:/image-net/chiffonier.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/chiffonier.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/chiffonier.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/chiffonier.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/chiffonier.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/chiffonier.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "chiffonier.png"
 
-python scale_estimation.py --image "E:/image-net/cicada.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/cicada.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/cicada.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/cicada.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/cicada.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/cicada.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "cicada.png"
 
-python scale_estimation.py --image "E:/image-net/cocktail-shaker.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/cocktail-shaker.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/cocktail-shaker.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/cocktail-shaker.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/cocktail-shaker.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/cocktail-shaker.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "cocktail-shaker.png"
 
-python scale_estimation.py --image "E:/image-net/coil.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/coil.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/coil.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/coil.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/coil.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/coil.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "coil.png"
 
-python scale_estimation.py --image "E:/image-net/cowboy-boot.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/cowboy-boot.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/cowboy-boot.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/cowboy-boot.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/cowboy-boot.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/cowboy-boot.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "cowboy-boot.png"
 
-python scale_estimation.py --image "E:/image-net/dandie-dinmont.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/dandie-dinmont.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/dandie-dinmont.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/dandie-dinmont.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/dandie-dinmont.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/dandie-dinmont.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "dandie-dinmont.png"
 
-python scale_estimation.py --image "E:/image-net/dial-telephone.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/dial-telephone.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/dial-telephone.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/dial-telephone.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/dial-telephone.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/dial-telephone.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "dial-telephone.png"
 
-python scale_estimation.py --image "E:/image-net/diaper.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/diaper.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/diaper.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/diaper.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/diaper.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/diaper.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "diaper.png"
 
-python scale_estimation.py --image "E:/image-net/dingo.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/dingo.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/dingo.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/dingo.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/dingo.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/dingo.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "dingo.png"
 
-python scale_estimation.py --image "E:/image-net/doormat.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/doormat.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/doormat.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/doormat.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/doormat.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/doormat.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "doormat.png"
 
-python scale_estimation.py --image "E:/image-net/ear.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/ear.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/ear.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/ear.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/ear.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/ear.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "ear.png"
 
-python scale_estimation.py --image "E:/image-net/flamingo.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/flamingo.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/flamingo.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/flamingo.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/flamingo.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/flamingo.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "flamingo.png"
 
-python scale_estimation.py --image "E:/image-net/flat-coated-retriever.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/flat-coated-retriever.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/flat-coated-retriever.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/flat-coated-retriever.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/flat-coated-retriever.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/flat-coated-retriever.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "flat-coated-retriever.png"
 
-python scale_estimation.py --image "E:/image-net/garden-spider.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/garden-spider.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/garden-spider.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/garden-spider.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/garden-spider.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/garden-spider.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "garden-spider.png"
 
-python scale_estimation.py --image "E:/image-net/gasmask.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/gasmask.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/gasmask.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/gasmask.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/gasmask.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/gasmask.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "gasmask.png"
 
-python scale_estimation.py --image "E:/image-net/giant-schnauzer.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/giant-schnauzer.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/giant-schnauzer.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/giant-schnauzer.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/giant-schnauzer.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/giant-schnauzer.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "giant-schnauzer.png"
 
-python scale_estimation.py --image "E:/image-net/gordon-setter.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/gordon-setter.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/gordon-setter.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/gordon-setter.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/gordon-setter.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/gordon-setter.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "gordon-setter.png"
 
-python scale_estimation.py --image "E:/image-net/grand-piano.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/grand-piano.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/grand-piano.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/grand-piano.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/grand-piano.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/grand-piano.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "grand-piano.png"
 
-python scale_estimation.py --image "E:/image-net/granny-smith.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/granny-smith.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/granny-smith.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/granny-smith.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/granny-smith.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/granny-smith.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "granny-smith.png"
 
-python scale_estimation.py --image "E:/image-net/green-lizard.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/green-lizard.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/green-lizard.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/green-lizard.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/green-lizard.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/green-lizard.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "green-lizard.png"
 
-python scale_estimation.py --image "E:/image-net/hair-spray.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/hair-spray.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/hair-spray.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/hair-spray.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/hair-spray.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/hair-spray.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "hair-spray.png"
 
-python scale_estimation.py --image "E:/image-net/hammer.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/hammer.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/hammer.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/hammer.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/hammer.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/hammer.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "hammer.png"
 
-python scale_estimation.py --image "E:/image-net/hamper.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/hamper.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/hamper.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/hamper.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/hamper.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/hamper.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "hamper.png"
 
-python scale_estimation.py --image "E:/image-net/hamster.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/hamster.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/hamster.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/hamster.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/hamster.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/hamster.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "hamster.png"
 
-python scale_estimation.py --image "E:/image-net/hand-blower.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/hand-blower.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/hand-blower.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/hand-blower.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/hand-blower.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/hand-blower.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "hand-blower.png"
 
-python scale_estimation.py --image "E:/image-net/hard-disc.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/hard-disc.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/hard-disc.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/hard-disc.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/hard-disc.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/hard-disc.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "hard-disc.png"
 
-python scale_estimation.py --image "E:/image-net/harvester.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/harvester.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/harvester.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/harvester.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/harvester.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/harvester.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "harvester.png"
 
-python scale_estimation.py --image "E:/image-net/hotdog.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/hotdog.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/hotdog.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/hotdog.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/hotdog.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/hotdog.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "hotdog.png"
 
-python scale_estimation.py --image "E:/image-net/hourglass.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/hourglass.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/hourglass.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/hourglass.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/hourglass.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/hourglass.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "hourglass.png"
 
-python scale_estimation.py --image "E:/image-net/house-finch.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/house-finch.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/house-finch.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/house-finch.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/house-finch.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/house-finch.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "house-finch.png"
 
-python scale_estimation.py --image "E:/image-net/ibizan-hound.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/ibizan-hound.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/ibizan-hound.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/ibizan-hound.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/ibizan-hound.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/ibizan-hound.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "ibizan-hound.png"
 
-python scale_estimation.py --image "E:/image-net/ice-cream.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/ice-cream.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/ice-cream.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/ice-cream.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/ice-cream.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/ice-cream.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "ice-cream.png"
 
-python scale_estimation.py --image "E:/image-net/indigo-bunting.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/indigo-bunting.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/indigo-bunting.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/indigo-bunting.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/indigo-bunting.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/indigo-bunting.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "indigo-bunting.png"
 
-python scale_estimation.py --image "E:/image-net/jaguar.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/jaguar.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/jaguar.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/jaguar.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/jaguar.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/jaguar.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "jaguar.png"
 
-python scale_estimation.py --image "E:/image-net/japanese-spaniel.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/japanese-spaniel.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/japanese-spaniel.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/japanese-spaniel.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/japanese-spaniel.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/japanese-spaniel.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "japanese-spaniel.png"
 
-python scale_estimation.py --image "E:/image-net/jellyfish.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/jellyfish.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/jellyfish.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/jellyfish.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/jellyfish.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/jellyfish.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "jellyfish.png"
 
-python scale_estimation.py --image "E:/image-net/kerry-blue-terrier.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/kerry-blue-terrier.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/kerry-blue-terrier.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/kerry-blue-terrier.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/kerry-blue-terrier.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/kerry-blue-terrier.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "kerry-blue-terrier.png"
 
-python scale_estimation.py --image "E:/image-net/kite.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/kite.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/kite.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/kite.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/kite.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/kite.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "kite.png"
 
-python scale_estimation.py --image "E:/image-net/leafhopper.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/leafhopper.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/leafhopper.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/leafhopper.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/leafhopper.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/leafhopper.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "leafhopper.png"
 
-python scale_estimation.py --image "E:/image-net/lesser-panda.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/lesser-panda.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/lesser-panda.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/lesser-panda.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/lesser-panda.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/lesser-panda.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "lesser-panda.png"
 
-python scale_estimation.py --image "E:/image-net/limpkin.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/limpkin.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/limpkin.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/limpkin.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/limpkin.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/limpkin.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "limpkin.png"
 
-python scale_estimation.py --image "E:/image-net/llama.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/llama.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/llama.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/llama.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/llama.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/llama.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "llama.png"
 
-python scale_estimation.py --image "E:/image-net/loudspeaker.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/loudspeaker.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/loudspeaker.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/loudspeaker.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/loudspeaker.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/loudspeaker.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "loudspeaker.png"
 
-python scale_estimation.py --image "E:/image-net/malinois.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/malinois.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/malinois.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/malinois.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/malinois.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/malinois.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "malinois.png"
 
-python scale_estimation.py --image "E:/image-net/maze.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/maze.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/maze.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/maze.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/maze.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/maze.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "maze.png"
 
-python scale_estimation.py --image "E:/image-net/mexican-hairless.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/mexican-hairless.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/mexican-hairless.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/mexican-hairless.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/mexican-hairless.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/mexican-hairless.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "mexican-hairless.png"
 
-python scale_estimation.py --image "E:/image-net/military-uniform.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/military-uniform.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/military-uniform.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/military-uniform.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/military-uniform.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/military-uniform.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "military-uniform.png"
 
-python scale_estimation.py --image "E:/image-net/mortar.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/mortar.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/mortar.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/mortar.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/mortar.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/mortar.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "mortar.png"
 
-python scale_estimation.py --image "E:/image-net/mosque.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/mosque.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/mosque.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/mosque.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/mosque.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/mosque.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "mosque.png"
 
-python scale_estimation.py --image "E:/image-net/mousetrap.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/mousetrap.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/mousetrap.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/mousetrap.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/mousetrap.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/mousetrap.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "mousetrap.png"
 
-python scale_estimation.py --image "E:/image-net/mushroom.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/mushroom.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/mushroom.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/mushroom.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/mushroom.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/mushroom.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "mushroom.png"
 
-python scale_estimation.py --image "E:/image-net/muzzle.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/muzzle.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/muzzle.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/muzzle.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/muzzle.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/muzzle.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "muzzle.png"
 
-python scale_estimation.py --image "E:/image-net/neck-brace.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/neck-brace.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/neck-brace.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/neck-brace.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/neck-brace.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/neck-brace.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "neck-brace.png"
 
-python scale_estimation.py --image "E:/image-net/newfoundland.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/newfoundland.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/newfoundland.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/newfoundland.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/newfoundland.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/newfoundland.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "newfoundland.png"
 
-python scale_estimation.py --image "E:/image-net/oxygen-mask.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/oxygen-mask.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/oxygen-mask.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/oxygen-mask.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/oxygen-mask.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/oxygen-mask.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "oxygen-mask.png"
 
-python scale_estimation.py --image "E:/image-net/paintbrush.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/paintbrush.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/paintbrush.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/paintbrush.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/paintbrush.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/paintbrush.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "paintbrush.png"
 
-python scale_estimation.py --image "E:/image-net/palace.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/palace.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/palace.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/palace.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/palace.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/palace.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "palace.png"
 
-python scale_estimation.py --image "E:/image-net/pekinese.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/pekinese.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/pekinese.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/pekinese.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/pekinese.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/pekinese.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "pekinese.png"
 
-python scale_estimation.py --image "E:/image-net/pencil-box.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/pencil-box.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/pencil-box.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/pencil-box.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/pencil-box.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/pencil-box.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "pencil-box.png"
 
-python scale_estimation.py --image "E:/image-net/persian-cat.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/persian-cat.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/persian-cat.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/persian-cat.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/persian-cat.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/persian-cat.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "persian-cat.png"
 
-python scale_estimation.py --image "E:/image-net/pinwheel.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/pinwheel.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/pinwheel.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/pinwheel.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/pinwheel.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/pinwheel.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "pinwheel.png"
 
-python scale_estimation.py --image "E:/image-net/plate-rack.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/plate-rack.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/plate-rack.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/plate-rack.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/plate-rack.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/plate-rack.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "plate-rack.png"
 
-python scale_estimation.py --image "E:/image-net/pomeranian.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/pomeranian.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/pomeranian.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/pomeranian.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/pomeranian.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/pomeranian.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "pomeranian.png"
 
-python scale_estimation.py --image "E:/image-net/proboscis-monkey.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/proboscis-monkey.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/proboscis-monkey.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/proboscis-monkey.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/proboscis-monkey.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/proboscis-monkey.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "proboscis-monkey.png"
 
-python scale_estimation.py --image "E:/image-net/purse.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/purse.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/purse.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/purse.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/purse.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/purse.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "purse.png"
 
-python scale_estimation.py --image "E:/image-net/quail.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/quail.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/quail.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/quail.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/quail.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/quail.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "quail.png"
 
-python scale_estimation.py --image "E:/image-net/quilt.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/quilt.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/quilt.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/quilt.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/quilt.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/quilt.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "quilt.png"
 
-python scale_estimation.py --image "E:/image-net/racket.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/racket.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/racket.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/racket.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/racket.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/racket.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "racket.png"
 
-python scale_estimation.py --image "E:/image-net/redbone.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/redbone.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/redbone.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/redbone.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/redbone.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/redbone.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "redbone.png"
 
-python scale_estimation.py --image "E:/image-net/rocking-chair.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/rocking-chair.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/rocking-chair.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/rocking-chair.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/rocking-chair.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/rocking-chair.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "rocking-chair.png"
 
-python scale_estimation.py --image "E:/image-net/sarong.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/sarong.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/sarong.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/sarong.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/sarong.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/sarong.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "sarong.png"
 
-python scale_estimation.py --image "E:/image-net/sax.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/sax.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/sax.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/sax.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/sax.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/sax.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "sax.png"
 
-python scale_estimation.py --image "E:/image-net/scabbard.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/scabbard.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/scabbard.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/scabbard.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/scabbard.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/scabbard.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "scabbard.png"
 
-python scale_estimation.py --image "E:/image-net/screw.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/screw.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/screw.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/screw.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/screw.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/screw.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "screw.png"
 
-python scale_estimation.py --image "E:/image-net/shih-tzu.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/shih-tzu.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/shih-tzu.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/shih-tzu.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/shih-tzu.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/shih-tzu.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "shih-tzu.png"
 
-python scale_estimation.py --image "E:/image-net/slot.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/slot.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/slot.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/slot.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/slot.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/slot.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "slot.png"
 
-python scale_estimation.py --image "E:/image-net/sloth-bear.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/sloth-bear.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/sloth-bear.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/sloth-bear.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/sloth-bear.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/sloth-bear.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "sloth-bear.png"
 
-python scale_estimation.py --image "E:/image-net/snail.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/snail.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/snail.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/snail.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/snail.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/snail.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "snail.png"
 
-python scale_estimation.py --image "E:/image-net/space-heater.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/space-heater.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/space-heater.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/space-heater.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/space-heater.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/space-heater.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "space-heater.png"
 
-python scale_estimation.py --image "E:/image-net/spotted-salamander.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/spotted-salamander.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/spotted-salamander.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/spotted-salamander.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/spotted-salamander.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/spotted-salamander.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "spotted-salamander.png"
 
-python scale_estimation.py --image "E:/image-net/strawberry.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/strawberry.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/strawberry.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/strawberry.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/strawberry.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/strawberry.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "strawberry.png"
 
-python scale_estimation.py --image "E:/image-net/sunglass.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/sunglass.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/sunglass.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/sunglass.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/sunglass.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/sunglass.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "sunglass.png"
 
-python scale_estimation.py --image "E:/image-net/table-lamp.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/table-lamp.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/table-lamp.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/table-lamp.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/table-lamp.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/table-lamp.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "table-lamp.png"
 
-python scale_estimation.py --image "E:/image-net/terrapin.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/terrapin.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/terrapin.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/terrapin.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/terrapin.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/terrapin.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "terrapin.png"
 
-python scale_estimation.py --image "E:/image-net/toaster.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/toaster.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/toaster.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/toaster.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/toaster.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/toaster.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "toaster.png"
 
-python scale_estimation.py --image "E:/image-net/toy-poodle.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/toy-poodle.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/toy-poodle.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/toy-poodle.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/toy-poodle.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/toy-poodle.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "toy-poodle.png"
 
-python scale_estimation.py --image "E:/image-net/trombone.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/trombone.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/trombone.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/trombone.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/trombone.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/trombone.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "trombone.png"
 
-python scale_estimation.py --image "E:/image-net/typewriter-keyboard.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/typewriter-keyboard.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/typewriter-keyboard.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/typewriter-keyboard.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/typewriter-keyboard.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/typewriter-keyboard.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "typewriter-keyboard.png"
 
-python scale_estimation.py --image "E:/image-net/vizsla.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/vizsla.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/vizsla.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/vizsla.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/vizsla.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/vizsla.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "vizsla.png"
 
-python scale_estimation.py --image "E:/image-net/whistle.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/whistle.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/whistle.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/whistle.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/whistle.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/whistle.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "whistle.png"
 
-python scale_estimation.py --image "E:/image-net/wig.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/wig.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/wig.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/wig.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/wig.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/wig.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "wig.png"
 
-python scale_estimation.py --image "E:/image-net/window-shade.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/window-shade.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/window-shade.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/window-shade.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/window-shade.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/window-shade.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "window-shade.png"
 
-python scale_estimation.py --image "E:/image-net/yellow-lady's-slipper.png" --cnn VGG19 --block2analyze 1
-python scale_estimation.py --image "E:/image-net/yellow-lady's-slipper.png" --cnn VGG19 --block2analyze 2
-python scale_estimation.py --image "E:/image-net/yellow-lady's-slipper.png" --cnn VGG19 --block2analyze 3
-python scale_estimation.py --image "E:/image-net/yellow-lady's-slipper.png" --cnn VGG19 --block2analyze 4
-python scale_estimation.py --image "E:/image-net/yellow-lady's-slipper.png" --cnn VGG19 --block2analyze 5
+python scale_estimation.py --image "E:/image-net/yellow-lady's-slipper.png" --cnn VGG19 --block2analyze 1 2 3 4 5
 python scale_tree_estimation.py --image "yellow-lady's-slipper.png"
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+from utils.cmd_utils import parse_agreement_args
+from utils.tree_utils import get_block_logs_agreement
+
+
+print("Welcome to scale_agreement_report.py!\n")
+args = parse_agreement_args()
+
+print("[*] Comparing block logs of {0} against {1}...".format(args.res_dir, args.ref_res_dir))
+df, summary = get_block_logs_agreement(args.ref_res_dir, args.res_dir)
+print("    Found {} common image(s).".format(df['image'].nunique()))
+print("[*] Done.\n")
+
+for _, row in summary.iterrows():
+    print("    Block #{0}: scale agreement {1:.2f} % over {2} image(s), "
+          "mean |scale diff| {3:.3f}, mean |fmap % diff| {4:.2f}.".format(int(row['block']),
+                                                                         100 * row['agreement'],
+                                                                         int(row['images']),
+                                                                         row['s_diff'],
+                                                                         row['fm_diff']))
+print()
+
+if args.csv is not None:
+    df.to_csv(args.csv, index=False)
+    print("[*] Find per-image comparison in: {}\n".format(args.csv))
+
+print("Implementation is finished.")
@@ -0,0 +1,99 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+import argparse
+import tempfile
+import json
+import time
+import platform
+
+import torch
+
+from utils.cmd_utils import parse_benchmark_args
+from utils.pipeline_utils import get_default_scale_search_net
+from utils.pipeline_utils import get_engine_model
+from utils.pipeline_utils import get_block_ids
+from utils.pipeline_utils import check_engine
+from utils.pipeline_utils import get_pipeline_kwargs
+from utils.bench_utils import get_synthetic_images
+from utils.bench_utils import benchmark_blocks
+from utils.bench_utils import run_isolated
+
+
+# Runs are spawned processes, so the script body must not run on their import.
+if __name__ == '__main__':
+    print("Welcome to scale_benchmark.py!\n")
+    args = parse_benchmark_args()
+
+    print("[*] Generating synthetic images ({0} per size: {1})...".format(args.num_images,
+                                                                        ", ".join(map(str, args.sizes))))
+    images_dir = os.path.join(args.work_dir, "images")
+    # Warmup images are others than the timed ones.
+    image_paths = get_synthetic_images(images_dir, args.sizes, num_images=args.warmup + args.num_images)
+    print("[*] Done.\n")
+
+    print("[*] Building {} network...".format(args.cnn))
+    model = get_engine_model(args)
+    check_engine(model, args.engine, args.stats, args.precision, args.channels_last)
+    # Every run is measured in its own process (so is its peak RSS), which gets the weights through shared memory.
+    if model is not None:
+        model.share_memory()
+    print("[*] Done.\n")
+
+    scale_search_net = get_default_scale_search_net(original_size=224)
+
+    # Every block alone, then all of them within a single sweep.
+    block_ids = get_block_ids(args.block2analyze)
+    blocks_net = [[block_id] for block_id in block_ids] + ([block_ids] if len(block_ids) > 1 else [])
+
+    runs = []
+    for blocks in blocks_net:
+        for size, size_image_paths in image_paths.items():
+            print("[*] Block #{0}, {1}px images...".format(", #".join(blocks), size))
+            res_dir = os.path.join(args.work_dir, "results", "size{}".format(size))
+            os.makedirs(res_dir, exist_ok=True)
+            # Persistent caches start empty in every run, so that neither earlier runs nor earlier versions serve it.
+            with tempfile.TemporaryDirectory(dir=args.work_dir) as cache_dir:
+                run_args = argparse.Namespace(**dict(vars(args),
+                                                     pyramid_cache_dir=None if args.pyramid_cache_dir is None
+                                                     else os.path.join(cache_dir, "pyramid"),
+                                                     stats_cache_dir=None if args.stats_cache_dir is None
+                                                     else os.path.join(cache_dir, "stats")))
+                run = run_isolated(benchmark_blocks, size_image_paths[args.warmup:], model, blocks,
+                                   scale_search_net, res_dir,
+                                   store_path=args.store,
+                                   warmup_paths=size_image_paths[:args.warmup],
+                                   plots=not args.no_plots,
+                                   **get_pipeline_kwargs(run_args))
+            run['image_size'] = size
+            runs.append(run)
+            print("    {0:.3f} image(s)/sec, {1:.3f} sec/image ({2}), peak RSS {3} MB (+{4} MB over the run).".format(
+                run['images_per_sec'], run['seconds_per_image'],
+                ", ".join("{0} {1:.3f}".format(stage, seconds) for stage, seconds in run['stages'].items() if seconds),
+                None if run['peak_rss_mb'] is None else int(run['peak_rss_mb']),
+                None if run['peak_rss_delta_mb'] is None else int(run['peak_rss_delta_mb'])))
+    print("[*] Done.\n")
+
+    report = {'tag': args.tag,
+              'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+              'platform': platform.platform(),
+              'python': platform.python_version(),
+              'torch': torch.__version__,
+              'threads': torch.get_num_threads(),
+              'cnn': args.cnn,
+              'engine': args.engine,
+              'stats': args.stats,
+              'precision': args.precision,
+              'channels_last': args.channels_last,
+              'search': args.search,
+              'plots': not args.no_plots,
+              'runs': runs}
+    os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+    with open(args.json, 'w') as f:
+        json.dump(report, f, indent=2)
+    print("[*] Find benchmark results in: {}\n".format(args.json))
+
+    print("Implementation is finished.")
@@ -0,0 +1,94 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+from tqdm import tqdm
+
+from utils.cmd_utils import parse_dataset_args
+from utils.dir_utils import create_folder
+from utils.dir_utils import get_image_paths
+from utils.image_utils import PlotRenderer
+from utils.store_utils import ResultsStore
+
+from utils.pipeline_utils import get_default_scale_search_net
+from utils.pipeline_utils import get_engine_model
+from utils.pipeline_utils import get_block_ids
+from utils.pipeline_utils import get_res_dir
+from utils.pipeline_utils import get_pipeline_kwargs
+from utils.parallel_utils import imap_chunks
+from utils.tree_utils import get_image_name
+from utils.tree_utils import get_summary_block_logs
+from utils.tree_utils import get_tree_solution
+from utils.tree_utils import plot_tree_solution
+from utils.tree_utils import append_dataset_log
+from utils.tree_utils import get_logged_images
+
+
+# Worker processes are spawned, so the script body must not run on their import.
+if __name__ == '__main__':
+    print("Welcome to scale_dataset_estimation.py!\n")
+    args = parse_dataset_args()
+
+    base_res_dir = args.res_dir
+    create_folder(base_res_dir, force=False, raise_except_if_exists=False)
+    csv_log = os.path.join(base_res_dir, "dataset_log.csv")
+
+    # Collect images, skipping the ones already present in dataset_log.csv.
+    image_paths = get_image_paths(args.images_dir, args.image_list, args.glob)
+    logged_images = set() if args.no_resume else get_logged_images(csv_log)
+    image_paths = [p for p in image_paths if get_image_name(p) not in logged_images]
+    print("[*] Found {0} image(s) to process ({1} already logged).\n".format(len(image_paths), len(logged_images)))
+
+    print("[*] Building {} network...".format(args.cnn))
+    model = get_engine_model(args)
+    print("[*] Done.\n")
+
+    block_ids = get_block_ids(args.block2analyze)
+    scale_search_net = get_default_scale_search_net(original_size=224)
+
+    images_per_batch = args.images_per_batch if args.engine == 'Batched' else 1
+    chunks = [image_paths[i:i + images_per_batch] for i in range(0, len(image_paths), images_per_batch)]
+
+    threads_per_worker = args.threads_per_worker
+    if threads_per_worker is None:
+        threads_per_worker = max(1, (os.cpu_count() or 1) // args.workers)
+
+    # Plots are rendered in the background, off the inference path (in place within worker processes).
+    renderer = PlotRenderer() if args.plots else None
+    store = None if args.store is None else ResultsStore(args.store)
+
+    failed = 0
+    for chunk, summaries, error in tqdm(imap_chunks(chunks, model, block_ids, scale_search_net,
+                                                    workers=args.workers,
+                                                    threads_per_worker=threads_per_worker,
+                                                    base_res_dir=base_res_dir,
+                                                    plots=args.plots,
+                                                    renderer=renderer,
+                                                    store=store,
+                                                    **get_pipeline_kwargs(args)),
+                                        total=len(chunks)):
+        if error is not None:
+            # Not logged, so the chunk is retried on the next (resumed) run.
+            failed += len(chunk)
+            print("[!] Failed to process {0}: {1}".format(", ".join(chunk), error))
+            continue
+
+        for image_path, summary in zip(chunk, summaries):
+            block_net, scale_net, df_dict = get_tree_solution(get_image_name(image_path),
+                                                              get_summary_block_logs(summary))
+            if args.plots:
+                renderer.submit(plot_tree_solution, block_net, scale_net,
+                                save_path=os.path.join(get_res_dir(image_path, base_res_dir), "tree_solution.png"))
+            append_dataset_log(csv_log, df_dict)
+
+    if renderer is not None:
+        renderer.close()
+    if store is not None:
+        store.close()
+
+    print("[*] Processed {0} image(s), failed {1}.".format(len(image_paths) - failed, failed))
+    print("[*] Find results in: {}\n".format(base_res_dir))
+
+    print("Implementation is finished.")
@@ -3,134 +3,150 @@
 """
 
 
-import numpy as np
 import os
-from PIL import Image
-
-from pytorch_grad_cam import GradCAM
+import time
+from contextlib import ExitStack
 
 from utils.cmd_utils import parse_args
 from utils.dir_utils import create_folder
-from utils.image_utils import plot_line
-
-from models.vgg19 import VGG19
-from utils.base_utils import get_scale_search_net
-from utils.base_utils import get_scale_search_inblock_matrix
-from utils.base_utils import get_filtered_inblock_matrix
+from utils.image_utils import PlotRenderer
+from utils.store_utils import ResultsStore
+from utils.tree_utils import get_image_name
+from utils.trace_utils import Tracer
+
+from utils.pipeline_utils import get_default_scale_search_net
+from utils.pipeline_utils import get_engine_model
+from utils.pipeline_utils import get_block_ids
+from utils.pipeline_utils import get_res_dir
+from utils.pipeline_utils import get_acts_grads_engine
+from utils.pipeline_utils import get_pyramid_cache
+from utils.pipeline_utils import get_stats_cache
+from utils.pipeline_utils import get_image_inblock_matrices
+from utils.pipeline_utils import get_block_result
+from utils.pipeline_utils import save_block_result
+from utils.pipeline_utils import get_precision_drift
+from utils.stats_utils import split_stats_inblock_matrix
 
 
 print("Welcome to scale_estimation.py!\n")
 args = parse_args()
 
-# Read input image.
-print("[*] Reading input image: {}...".format(os.path.split(args.image)[-1]))
-img = Image.open(args.image)
-print("[*] Done.\n")
+# Spans & counters of the instrumented pipeline (see utils/trace_utils.py).
+tracer = None if args.trace is None else Tracer(torch_profiler=args.trace_torch).start()
 
 # Prepare result-directory.
 base_res_dir = "./results"
-res_dir = os.path.join(base_res_dir,
-                       os.path.splitext(os.path.split(args.image)[-1])[0])
+res_dir = get_res_dir(args.image, base_res_dir)
 create_folder(base_res_dir, force=False, raise_except_if_exists=False)
 create_folder(res_dir, force=False, raise_except_if_exists=False)
 
 # Read CNN model (VGG19 only for now).
-model = None
-if args.cnn == 'VGG19':
-    print("[*] Building VGG19 network...")
-    model = VGG19()
-    print("[*] Done.\n")
+print("[*] Building {} network...".format(args.cnn))
+model = get_engine_model(args)
+print("[*] Done.\n")
 
-# Define Activations-&-Gradients extractor (GradCAM-based)
-target_layers = []
-if args.block2analyze == '1':
-    target_layers = [model.block1[-1]]
-elif args.block2analyze == '2':
-    target_layers = [model.block2[-1]]
-elif args.block2analyze == '3':
-    target_layers = [model.block3[-1]]
-elif args.block2analyze == '4':
-    target_layers = [model.block4[-1]]
-elif args.block2analyze == '5':
-    target_layers = [model.block5[-1]]
-acts_grads_engine = GradCAM(model=model, target_layers=target_layers)
+# Define Activations-&-Gradients extractor (activations-only or GradCAM-based)
+block_ids = get_block_ids(args.block2analyze)
+acts_grads_engine = get_acts_grads_engine(model, block_ids, args.engine, stats=args.stats,
+                                          precision=args.precision, channels_last=args.channels_last,
+                                          features_path=args.features_path)
+engine_stack = ExitStack()
+if acts_grads_engine is not None:
+    engine_stack.enter_context(acts_grads_engine)
 
 # Define Scale-Search-Net
-scale_search_net = get_scale_search_net(scale_net=[-3.0,
-                                                   -2.75, -2.5, -2.25, -2.0,
-                                                   -1.75, -1.5, -1.25,
-                                                   0,
-                                                   1.25, 1.5, 1.75, 2.0,
-                                                   2.25, 2.5, 2.75, 3.0,
-                                                   3.25, 3.5, 3.75, 4.0],
-                                        original_size=224)
-
-SCALES_NUM = len(scale_search_net.keys())
-
-print("[*] Step 1 / 3: Calculating feature-maps ({0} Block #{1}) upon multiple scales...".format(args.cnn, args.block2analyze))
-scale_net, inblock_matrix = get_scale_search_inblock_matrix(img, acts_grads_engine, scale_search_net)
-print("    Got matrix of shape: {}.".format(inblock_matrix.shape))
+scale_search_net = get_default_scale_search_net(original_size=224)
+
+# Plots are rendered in the background, while the next blocks are processed.
+renderer = None if args.no_plots else PlotRenderer()
+
+store = None if args.store is None else ResultsStore(args.store)
+
+print("[*] Step 1 / 3: Calculating feature-maps ({0} Block #{1}) upon multiple scales...".format(args.cnn, ", #".join(block_ids)))
+start = time.time()
+scale_net, inblock_matrices, saved_num = get_image_inblock_matrices(args.image, model, block_ids, scale_search_net,
+                                                                    search=args.search,
+                                                                    coarse_step=args.coarse_step,
+                                                                    patience=args.patience,
+                                                                    engine=args.engine,
+                                                                    acts_grads_engine=acts_grads_engine,
+                                                                    max_memory_mb=args.max_memory_mb,
+                                                                    stats=args.stats,
+                                                                    precision=args.precision,
+                                                                    channels_last=args.channels_last,
+                                                                    features_path=args.features_path,
+                                                                    pyramid_cache=get_pyramid_cache(args),
+                                                                    stats_cache=get_stats_cache(args))
+seconds = time.time() - start
+if args.search != 'full':
+    print("    {0} search evaluated {1} scale(s) out of {2}, saving {3} forward pass(es).".format(
+        args.search, len(scale_net), len(scale_search_net), saved_num))
+for block_id, inblock_matrix in zip(block_ids, inblock_matrices):
+    print("    Block #{0}: got matrix of shape: {1}.".format(block_id, inblock_matrix.shape))
+# An idle engine would keep its hooks on the model (e.g. during the precision check), so it is released.
+engine_stack.close()
 print("[*] Done.\n")
 
-plot_line(x_values=scale_net,
-          y_values=inblock_matrix,
-          x_label="Input scale: \n2 means x2-UpSample, \n -2 means x2-DownSample",
-          y_label="AvgPool[ReLU(...)]",
-          save_path=os.path.join(res_dir,
-                                 'out_block{}.png'.format(args.block2analyze)))
-
-print("[*] Step 2 / 3: Choosing meaningful feature-maps...")
-fmap_save, filtered_inblock_matrix = get_filtered_inblock_matrix(inblock_matrix)
-fmap_save_perc = len(fmap_save) / inblock_matrix.shape[1] * 100
-print("    Got matrix of shape: {}.".format(filtered_inblock_matrix.shape))
-print("    Found {0} appropriate feature maps out of {1} ({2:.2f} %).".format(len(fmap_save),
-                                                                              inblock_matrix.shape[1],
-                                                                              fmap_save_perc))
-print("[*] Done.\n")
-
-plot_line(x_values=scale_net,
-          y_values=filtered_inblock_matrix,
-          x_label="Input scale: \n2 means x2-UpSample, \n -2 means x2-DownSample",
-          y_label="AvgPool[ReLU(...)]",
-          save_path=os.path.join(res_dir,
-                                 'out_block{}_filtered.png'.format(args.block2analyze)))
-
-print("[*] Step 3 / 3: Merging meaningful feature_maps...")
-filtered_merged_inblock_matrix = np.mean(filtered_inblock_matrix, axis=1)
-print("    Got matrix of shape: {}.".format(filtered_merged_inblock_matrix.shape))
-plot_line(x_values=scale_net,
-          y_values=filtered_merged_inblock_matrix,
-          x_label="Input scale: \n2 means x2-UpSample, \n -2 means x2-DownSample",
-          y_label="AvgPool[ReLU(...)]",
-          save_path=os.path.join(res_dir,
-                                 'out_block{}_filtered_merged.png'.format(args.block2analyze)))
-print("[*] Done.\n")
+for block_id, inblock_matrix in zip(block_ids, inblock_matrices):
+    # The first statistic is the primary one, the others are saved into <res_dir>/<stat>.
+    for stat, stat_inblock_matrix in zip(args.stats, split_stats_inblock_matrix(inblock_matrix, args.stats)):
+        print("[*] Block #{0} ({1}):".format(block_id, stat))
+        print("[*] Step 2 / 3: Choosing meaningful feature-maps...")
+        block_result = get_block_result(scale_net, stat_inblock_matrix)
+        print("    Got matrix of shape: {}.".format(block_result['filtered_inblock_matrix'].shape))
+        print("    Found {0} appropriate feature maps out of {1} ({2:.2f} %).".format(len(block_result['fmap_save']),
+                                                                                      stat_inblock_matrix.shape[1],
+                                                                                      block_result['fmap_save_perc']))
+        print("[*] Done.\n")
+
+        print("[*] Step 3 / 3: Merging meaningful feature_maps...")
+        print("    Got matrix of shape: {}.".format(block_result['filtered_merged_inblock_matrix'].shape))
+        save_block_result(res_dir if stat == args.stats[0] else os.path.join(res_dir, stat),
+                          block_id, scale_net, block_result, plots=not args.no_plots, renderer=renderer)
+        if store is not None:
+            store.add_block(get_image_name(args.image), block_id, block_result['scale'],
+                            float("{0:.2f}".format(block_result['fmap_save_perc'])),
+                            scales_evaluated=len(scale_net),
+                            stat=stat,
+                            scale_net=scale_net,
+                            curve=block_result['filtered_merged_inblock_matrix'])
+        print("[*] Done.\n")
+
+if args.check_precision:
+    print("[*] Checking {0}{1} against the fp32 baseline...".format(args.precision,
+                                                                    ", channels_last" if args.channels_last else ""))
+    drift = get_precision_drift(args.image, model, block_ids, scale_search_net,
+                                precision=args.precision,
+                                channels_last=args.channels_last,
+                                stats=args.stats,
+                                engine=args.engine,
+                                features_path=args.features_path,
+                                pyramid_cache=get_pyramid_cache(args),
+                                max_memory_mb=args.max_memory_mb)
+    for block_id, block_drift in drift.items():
+        print("    Block #{0}: scale {1} (fp32: {2}), fmaps {3:.2f} % (fp32: {4:.2f} %), "
+              "max abs / rel error {5:.2e} / {6:.2e}.".format(block_id,
+                                                            block_drift['scale'], block_drift['scale_fp32'],
+                                                            block_drift['fmap_perc'], block_drift['fmap_perc_fp32'],
+                                                            block_drift['max_abs_err'], block_drift['max_rel_err']))
+    print("[*] Done.\n")
 
-# ---------------------------------------- #
-
-# Saving info as TXT
-create_folder(os.path.join(res_dir, "block_logs"), force=False, raise_except_if_exists=False)
-with open(os.path.join(res_dir,
-                       "block_logs",
-                       "block_{}.txt".format(args.block2analyze)),
-          "w") as f:
-    i_max = np.argmax(filtered_merged_inblock_matrix)
-    i_min = np.argmin(filtered_merged_inblock_matrix)
-    if not ((i_max not in [0, SCALES_NUM-1]) or (i_min not in [0, SCALES_NUM-1])):
-        f.write("None")
-    elif (i_max not in [0, SCALES_NUM-1]) and (i_min not in [0, SCALES_NUM-1]):
-        a = abs(filtered_merged_inblock_matrix[i_max])
-        b = abs(filtered_merged_inblock_matrix[i_min])
-        if a > b:
-            f.write(str(scale_net[i_max]))
-        else:
-            f.write(str(scale_net[i_min]))
-
-    elif i_max not in [0, SCALES_NUM-1]:
-        f.write(str(scale_net[i_max]))
-    else:
-        f.write(str(scale_net[i_min]))
-    f.write("\n{0:.2f}".format(fmap_save_perc))
+if renderer is not None:
+    renderer.close()
+if store is not None:
+    store.add_image(get_image_name(args.image), path=args.image, stat=args.stats[0], seconds=seconds)
+    store.close()
+
+if tracer is not None:
+    tracer.stop()
+    tracer.save(args.trace)
+    summary = tracer.get_summary()
+    print("[*] Trace summary:")
+    for name, span_summary in sorted(summary['spans'].items(), key=lambda item: -item[1]['seconds']):
+        print("    {0}: {1} span(s), {2:.3f} sec.".format(name, span_summary['count'], span_summary['seconds']))
+    for name, value in summary['counters'].items():
+        print("    {0}: {1}.".format(name, value))
+    print("[*] Find the trace in: {}\n".format(args.trace))
 
 print("[*] Find results in: {}\n".format(res_dir))
 
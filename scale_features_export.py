@@ -0,0 +1,45 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+
+from utils.cmd_utils import parse_export_args
+from utils.pipeline_utils import get_model
+from utils.pipeline_utils import get_block_ids
+from utils.pipeline_utils import get_default_scale_search_net
+from utils.export_utils import get_features_path
+from utils.export_utils import export_features
+from utils.export_utils import export_features_onnx
+from utils.export_utils import check_features_onnx
+
+
+print("Welcome to scale_features_export.py!\n")
+args = parse_export_args()
+features_path = get_features_path(args.format, args.features_path)
+
+print("[*] Building VGG19 network...")
+model = get_model('VGG19')
+print("[*] Done.\n")
+
+block_ids = get_block_ids(args.block2analyze)
+print("[*] Exporting {0} of Block #{1} as {2}...".format("full outputs" if args.full_maps else "pooled ReLU means",
+                                                        ", #".join(block_ids), args.format))
+os.makedirs(os.path.dirname(os.path.abspath(features_path)), exist_ok=True)
+if args.format == 'ONNX':
+    export_features_onnx(model, block_ids, features_path, pooled=not args.full_maps)
+else:
+    export_features(model, block_ids, features_path, pooled=not args.full_maps)
+print("[*] Done.\n")
+
+if args.check and (args.format == 'ONNX'):
+    print("[*] Checking the ONNX extractor against the eager one...")
+    for size, error in check_features_onnx(features_path, model, block_ids,
+                                           get_default_scale_search_net(original_size=224)).items():
+        print("    Size {0}: max relative error {1:.2e}.".format(size, error))
+    print("[*] Done.\n")
+
+print("[*] Find the extractor in: {}\n".format(features_path))
+
+print("Implementation is finished.")
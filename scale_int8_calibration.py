@@ -0,0 +1,46 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+from PIL import Image
+
+from utils.cmd_utils import parse_calibration_args
+from utils.dir_utils import get_image_paths
+from utils.nn_utils import get_image_tensor
+from utils.base_utils import get_scale_search_net
+from utils.base_utils import get_scale_transform
+
+from models.vgg19_int8 import VGG19Int8
+
+
+print("Welcome to scale_int8_calibration.py!\n")
+args = parse_calibration_args()
+
+image_paths = get_image_paths(args.images_dir, pattern=args.glob)[:args.num_images]
+calib_net = get_scale_search_net(scale_net=args.calib_scales, original_size=224)
+print("[*] Calibrating upon {0} image(s) at {1} scale(s)...".format(len(image_paths), len(calib_net)))
+
+print("[*] Building VGG19-int8 network ({} backend)...".format(args.backend))
+model = VGG19Int8(backend=args.backend)
+print("[*] Done.\n")
+
+
+def get_calibration_batches():
+    for image_path in image_paths:
+        img = Image.open(image_path)
+        for size in calib_net.values():
+            yield get_image_tensor(img, get_scale_transform(size))
+
+
+print("[*] Collecting activation ranges...")
+model.calibrate(get_calibration_batches())
+model.convert()
+print("[*] Done.\n")
+
+os.makedirs(os.path.dirname(os.path.abspath(args.int8_weights)), exist_ok=True)
+model.save(args.int8_weights)
+print("[*] Find calibrated weights in: {}\n".format(args.int8_weights))
+
+print("Implementation is finished.")
@@ -0,0 +1,137 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import sys
+import json
+import time
+import threading
+import socketserver
+from contextlib import ExitStack
+
+from utils.cmd_utils import parse_server_args
+from utils.image_utils import PlotRenderer
+from utils.store_utils import ResultsStore
+
+from utils.pipeline_utils import get_default_scale_search_net
+from utils.pipeline_utils import get_engine_model
+from utils.pipeline_utils import get_block_ids
+from utils.pipeline_utils import get_acts_grads_engine
+from utils.pipeline_utils import get_pipeline_kwargs
+from utils.pipeline_utils import estimate_image_scales
+
+
+BLOCK_IDS = ['1', '2', '3', '4', '5']
+
+
+class ScaleEstimationWorker:
+    """
+    Keeps the CNN loaded and serves jobs one by one. A job is a line holding
+    either an image path or a JSON object {"image": <path>, "blocks": [...]}.
+    The answer is a JSON line with per-block scale decisions and fmap %.
+    """
+
+    def __init__(self, args):
+        self.args = args
+        self.model = get_engine_model(args)
+        self.scale_search_net = get_default_scale_search_net(original_size=224)
+        # A single engine is kept hooked to the model, rebuilt when the blocks of a job change.
+        self.engine_stack = ExitStack()
+        self.engine_key = None
+        self.engine = None
+        self.pipeline_kwargs = get_pipeline_kwargs(args)
+        # Answers do not wait for the PNGs; block logs are written before answering.
+        self.renderer = PlotRenderer() if args.plots else None
+        self.store = None if args.store is None else ResultsStore(args.store)
+        self.lock = threading.Lock()
+
+    def get_engine(self, block_ids):
+        if self.args.engine in ['Batched', 'Tiled']:
+            return None
+        key = tuple(block_ids)
+        if key != self.engine_key:
+            # Idle engines would keep their hooks on the shared model, so the previous one is released.
+            self.engine_stack.close()
+            self.engine_key, self.engine = None, None
+            self.engine = self.engine_stack.enter_context(
+                get_acts_grads_engine(self.model, block_ids, self.args.engine, stats=self.args.stats,
+                                      precision=self.args.precision,
+                                      channels_last=self.args.channels_last,
+                                      features_path=self.args.features_path))
+            self.engine_key = key
+        return self.engine
+
+    def get_job(self, line):
+        line = line.strip()
+        job = json.loads(line) if line.startswith('{') else {'image': line}
+        if not isinstance(job, dict) or not isinstance(job.get('image'), str):
+            raise ValueError("a job is an image path or {\"image\": <path>, \"blocks\": [...]}, got: " + line)
+        blocks = job.get('blocks', self.args.block2analyze)
+        if (not isinstance(blocks, list)) or (not blocks) or \
+                any(str(block_id) not in BLOCK_IDS for block_id in blocks):
+            raise ValueError("'blocks' must be a non-empty list of {0}, got: {1}".format(BLOCK_IDS, blocks))
+        return job, get_block_ids(blocks)
+
+    def process(self, line):
+        job = dict()
+        start = time.time()
+        try:
+            job, block_ids = self.get_job(line)
+            with self.lock:
+                summary = estimate_image_scales(job['image'], self.model, block_ids, self.scale_search_net,
+                                                acts_grads_engine=self.get_engine(block_ids),
+                                                base_res_dir=self.args.res_dir,
+                                                plots=self.args.plots,
+                                                renderer=self.renderer,
+                                                store=self.store,
+                                                **self.pipeline_kwargs)
+                if self.store is not None:
+                    # Committed per job, so that readers see every answered image.
+                    self.store.flush()
+        except Exception as e:
+            return {'image': job.get('image'), 'error': '{0}: {1}'.format(type(e).__name__, e)}
+        return {'image': job['image'], 'blocks': summary, 'time': round(time.time() - start, 3)}
+
+    def close(self):
+        self.engine_stack.close()
+        if self.renderer is not None:
+            self.renderer.close()
+        if self.store is not None:
+            self.store.close()
+
+
+class ScaleEstimationHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            line = line.decode('utf-8', errors='replace')
+            if not line.strip():
+                continue
+            answer = self.server.worker.process(line)
+            self.wfile.write((json.dumps(answer) + '\n').encode('utf-8'))
+            self.wfile.flush()
+
+
+if __name__ == '__main__':
+    args = parse_server_args()
+
+    print("[*] Building {} network...".format(args.cnn), file=sys.stderr)
+    worker = ScaleEstimationWorker(args)
+    print("[*] Done.\n", file=sys.stderr)
+
+    if args.port:
+        with socketserver.ThreadingTCPServer((args.host, args.port), ScaleEstimationHandler) as server:
+            server.worker = worker
+            print("[*] Listening on {0}:{1}...".format(args.host, args.port), file=sys.stderr)
+            try:
+                server.serve_forever()
+            finally:
+                worker.close()
+    else:
+        print("[*] Reading jobs from stdin...", file=sys.stderr)
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            print(json.dumps(worker.process(line)), flush=True)
+        worker.close()
@@ -4,64 +4,78 @@
 
 
 import os
-import numpy as np
-import pandas as pd
 
-from utils.cmd_utils import parse_args
-from utils.image_utils import plot_scatter
+from utils.cmd_utils import parse_tree_args
+from utils.tree_utils import get_image_name
+from utils.tree_utils import read_block_logs
+from utils.tree_utils import read_dataset_block_logs
+from utils.tree_utils import get_block_arrays
+from utils.tree_utils import get_tree_solution
+from utils.tree_utils import get_tree_solutions
+from utils.tree_utils import get_dataset_histograms
+from utils.tree_utils import save_dataset_histograms
+from utils.tree_utils import plot_dataset_histograms
+from utils.tree_utils import plot_tree_solution
+from utils.tree_utils import append_dataset_log
+from utils.store_utils import ResultsStore
 
 
 print("Welcome to scale_tree_estimation.py!\n")
-args = parse_args()
+args = parse_tree_args()
 
-# Prepare result-directory.
 base_dir = "./results"
-block_logs_dir = os.path.join(base_dir,
-                              os.path.splitext(os.path.split(args.image)[-1])[0],
-                              "block_logs")
+# Both modes read the stored primary statistic of every image, unless --stats is given.
+stat = None if args.stats is None else args.stats[0]
 
-block_net = []
-scale_net = []
-df_dict = dict()
-df_dict['image'] = [os.path.splitext(os.path.split(args.image)[-1])[0]]
+if args.bulk:
+    # All images at once: one array of per-block decisions, vectorized over images.
+    print("[*] Reading block results of every image...")
+    if args.store is not None:
+        with ResultsStore(args.store) as store:
+            rows = store.get_block_rows(stat)
+    else:
+        rows = read_dataset_block_logs(base_dir)
+    image_names, block_ids, scales, fm_percs = get_block_arrays(rows)
+    print("    Got {0} image(s), Block #{1}.".format(len(image_names), ", #".join(map(str, block_ids))))
+    print("[*] Done.\n")
 
-for txt_name in os.listdir(block_logs_dir):
-    name = os.path.splitext(txt_name)[0]
-    block_id = int(name.split('_')[-1])
+    print("[*] Aggregating tree solutions...")
+    tree_scales, df_dict = get_tree_solutions(image_names, block_ids, scales, fm_percs)
+    append_dataset_log(os.path.join(base_dir, "dataset_log.csv"), df_dict, mode='w')
 
-    with open(os.path.join(block_logs_dir, txt_name), 'rt') as f:
-        txt_lines = f.read().splitlines()
-    assert len(txt_lines) == 2
+    histograms = get_dataset_histograms(block_ids, scales, fm_percs, tree_scales)
+    save_dataset_histograms(histograms, os.path.join(base_dir, "dataset_histograms.csv"))
+    if not args.no_plots:
+        plot_dataset_histograms(histograms, save_path=os.path.join(base_dir, "dataset_histograms.png"))
+    print("[*] Done.\n")
 
-    scale, fm_perc = txt_lines
-    if scale == 'None':
-        scale = None
-    else:
-        scale = float(scale)
-        block_net.append(block_id)
-        scale_net.append(scale)
-    fm_perc = float(fm_perc)
+    print("[*] Find results in: {}\n".format(base_dir))
+else:
+    # Prepare result-directory.
+    image_name = get_image_name(args.image)
+    block_logs_dir = os.path.join(base_dir,
+                                  image_name,
+                                  "block_logs")
 
-    df_dict['b{}_s'.format(block_id)] = [scale]
-    df_dict['b{}_fm'.format(block_id)] = [fm_perc]
-df_dict['s'] = [np.mean(scale_net)]
+    if args.store is not None:
+        # Indexed lookup of the image's block results, no block_logs listing.
+        with ResultsStore(args.store) as store:
+            block_logs = store.get_block_logs(image_name, stat)
+    else:
+        block_logs = read_block_logs(block_logs_dir)
+    block_net, scale_net, df_dict = get_tree_solution(image_name, block_logs)
 
-# ---------------------------------------- #
+    # ---------------------------------------- #
 
-# Saving results as PLT
-plot_scatter(x_values=block_net,
-             y_values=scale_net,
-             x_label="Block",
-             y_label="Chosen Scale",
-             x_lim=(0, 6),
-             y_lim=(-6, 6),
-             save_path=os.path.join(base_dir,
-                                    os.path.splitext(os.path.split(args.image)[-1])[0],
-                                    "tree_solution.png"))
-# Saving results as CSV
-df = pd.DataFrame.from_dict(df_dict)
-csv_log = os.path.join(base_dir,
-                       "dataset_log.csv")
-df.to_csv(csv_log, index=False, mode='a', header=not os.path.exists(csv_log))
+    # Saving results as PLT
+    if not args.no_plots:
+        plot_tree_solution(block_net, scale_net,
+                           save_path=os.path.join(base_dir,
+                                                  image_name,
+                                                  "tree_solution.png"))
+    # Saving results as CSV
+    append_dataset_log(os.path.join(base_dir,
+                                    "dataset_log.csv"),
+                       df_dict)
 
 print("Implementation is finished.")
@@ -8,10 +8,13 @@ from collections import OrderedDict
 from tqdm import tqdm
 
 import torch
-import torch.nn as nn
 from torchvision import transforms
 
 from utils.nn_utils import get_image_tensor
+from utils.stats_utils import DEFAULT_STATS
+from utils.stats_utils import get_channel_stats
+from utils.trace_utils import span
+from utils.trace_utils import count
 
 
 def get_scale_search_net(scale_net=[-3.0, -2.0, -1.6, 0, 1.5, 2.0, 2.5, 3.0, 4.0],
@@ -30,65 +33,137 @@ def get_scale_search_net(scale_net=[-3.0, -2.0, -1.6, 0, 1.5, 2.0, 2.5, 3.0, 4.0
     return OrderedDict(zip(scale_net, size_net))
 
 
+def get_block_ids(block_ids):
+    return sorted(set(str(block_id) for block_id in block_ids), key=int)
+
+
+def get_scale_transform(size):
+    return transforms.Compose([
+        transforms.Resize(size),
+        transforms.ToTensor(),
+        transforms.Normalize(
+            mean=[0.485, 0.456, 0.406],
+            std=[0.229, 0.224, 0.225]
+        )])
+
+
 def get_scale_search_inblock_matrix(img,
                                     acts_grads_engine,
-                                    scale_search_net):
+                                    scale_search_net,
+                                    pyramid=None,
+                                    stats=DEFAULT_STATS):
     """
     inblock_matrix: [
                         [{blob_scale-1, fmap_1}, ..., {blob_scale-1, fmap_M}],
                         ...
                         [{blob_scale-N, fmap_1}, ..., {blob_scale-N, fmap_M}],
                     ]
+
+    One inblock_matrix is returned per target layer of acts_grads_engine
+    (in forward order), so all blocks are collected within a single sweep.
+    If pyramid (see pyramid_utils.PyramidCache.get) is given, its levels
+    are used instead of resizing img.
+    Full feature maps are reduced to the per-channel statistics of stats
+    (see stats_utils.get_channel_stats), concatenated along fmaps.
     """
 
     scale_net = list(scale_search_net.keys())
-    value_net = [[] for _ in range(len(scale_net))]
-
-    inblock_matrix = OrderedDict(zip(scale_net, value_net))
+    value_nets = None
 
     for scale_curr, size_curr in tqdm(scale_search_net.items()):
-        transform = transforms.Compose([
-            transforms.Resize(size_curr),
-            transforms.ToTensor(),
-            transforms.Normalize(
-                mean=[0.485, 0.456, 0.406],
-                std=[0.229, 0.224, 0.225]
-            )])
+        with span('resize', scale=scale_curr, size=size_curr):
+            if pyramid is not None:
+                batch_t = torch.unsqueeze(pyramid[scale_curr], 0)
+            else:
+                batch_t = get_image_tensor(img, get_scale_transform(size_curr))
+        with span('engine', scale=scale_curr, size=size_curr):
+            acts, grads = acts_grads_engine(input_tensor=batch_t, targets=None)
+        assert (not grads) or (len(acts) == len(grads))  # Activations-only engines return no grads.
+        count('forward_passes', batch_t.shape[0])
+        count('host_bytes', sum(a.nbytes for a in acts) + sum(g.nbytes for g in grads))
+
+        if value_nets is None:
+            value_nets = [[] for _ in range(len(acts))]
+        assert len(acts) == len(value_nets)  # Ensure every target layer fired once.
+
+        with span('pooling', scale=scale_curr):
+            for value_net, act in zip(value_nets, acts):
+                # Reducing engines (see ActivationsExtractor reduce) return [1, len(stats) * C] already.
+                if act.ndim == 4:
+                    act = get_channel_stats(torch.from_numpy(act), stats).numpy()
+
+                blob = act.flatten()
+                value_net.append(blob)
+                count('retained_bytes', blob.nbytes)
+
+    return scale_net, [np.array(value_net) for value_net in value_nets]
+
+
+def get_fmap_save_mask(inblock_matrices):
+    """
+    Vectorized filtering procedure over [..., scales, fmaps] matrices
+    (e.g. [images, scales, fmaps]). Returns [..., fmaps] boolean mask of
+    the meaningful feature maps.
+    """
 
-        batch_t = get_image_tensor(img, transform)
-        acts, grads = acts_grads_engine(input_tensor=batch_t, targets=None)
-        assert len(acts) == len(grads)
-        assert len(grads) == 1  # Ensure target_layers was chosen with len == 1.
+    inblock_matrices = np.asarray(inblock_matrices)
+    scales_num = inblock_matrices.shape[-2]
 
-        blob_t = nn.ReLU()(torch.from_numpy(acts[0]))
-        blob_t = torch.nn.AdaptiveAvgPool2d((1, 1))(blob_t)
+    v_max, v_min = inblock_matrices.max(axis=-2), inblock_matrices.min(axis=-2)
+    i_max, i_min = np.argmax(inblock_matrices, axis=-2), np.argmin(inblock_matrices, axis=-2)
 
-        blob = blob_t.detach().numpy().flatten()
-        inblock_matrix[scale_curr].extend(blob)
+    # Пропускаем случаи констатной связи.
+    is_const = np.isclose(v_max, v_min)
+    # Пропускаем случаи строгой монотонности.
+    is_monotonic = ((i_max == 0) | (i_max == scales_num - 1)) & ((i_min == 0) | (i_min == scales_num - 1))
 
-    return scale_net, np.array(list(inblock_matrix.values()))
+    return ~is_const & ~is_monotonic
 
 
 def get_filtered_inblock_matrix(inblock_matrix):
-    scales_num, fmap_num = inblock_matrix.shape
-    fmap_save = []
-
-    for i in range(fmap_num):
-        fmap = inblock_matrix[:, i]
-
-        # Filtering procedure.
-        v_max, i_max, v_min, i_min = fmap.max(), np.argmax(fmap), fmap.min(), np.argmin(fmap)
-        v_left, v_right = fmap[0], fmap[-1]
-
-        if np.isclose(v_max, v_min):
-            # print('Skip {}, due to 1'.format(i))
-            # Пропускаем случаи констатной связи.
-            continue
-        elif not ((i_max not in [0, scales_num - 1]) or (i_min not in [0, scales_num - 1])):
-            # print('Skip {}, due to 2'.format(i))
-            # Пропускаем случаи строгой монотонности.
-            continue
-        else:
-            fmap_save.append(i)
+    fmap_save = np.flatnonzero(get_fmap_save_mask(inblock_matrix)).tolist()
 
     return fmap_save, inblock_matrix[:, fmap_save]
+
+
+def get_filtered_inblock_matrices(inblock_matrices):
+    """
+    Batched get_filtered_inblock_matrix over [images, scales, fmaps].
+    Returns fmap_save per image, [images, fmaps] mask and [images, scales]
+    merged (mean over meaningful feature maps) curves.
+    """
+
+    inblock_matrices = np.asarray(inblock_matrices)
+    fmap_save_mask = get_fmap_save_mask(inblock_matrices)
+    fmap_saves = [np.flatnonzero(mask).tolist() for mask in fmap_save_mask]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        filtered_merged_inblock_matrices = (np.sum(inblock_matrices * fmap_save_mask[:, None, :], axis=-1) /
+                                            np.sum(fmap_save_mask, axis=-1)[:, None])
+
+    return fmap_saves, fmap_save_mask, filtered_merged_inblock_matrices
+
+
+def get_block_scale(scale_net, filtered_merged_inblock_matrix):
+    """
+    Chooses block scale by the position of the merged curve extrema.
+    None is returned if both extrema lie on the edges of scale_net.
+    """
+
+    scales_num = len(scale_net)
+    i_max = np.argmax(filtered_merged_inblock_matrix)
+    i_min = np.argmin(filtered_merged_inblock_matrix)
+
+    if not ((i_max not in [0, scales_num - 1]) or (i_min not in [0, scales_num - 1])):
+        return None
+    elif (i_max not in [0, scales_num - 1]) and (i_min not in [0, scales_num - 1]):
+        a = abs(filtered_merged_inblock_matrix[i_max])
+        b = abs(filtered_merged_inblock_matrix[i_min])
+        if a > b:
+            return scale_net[i_max]
+        else:
+            return scale_net[i_min]
+    elif i_max not in [0, scales_num - 1]:
+        return scale_net[i_max]
+    else:
+        return scale_net[i_min]
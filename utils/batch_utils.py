@@ -0,0 +1,177 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import numpy as np
+from tqdm import tqdm
+
+import torch
+import torch.nn as nn
+
+from pytorch_grad_cam.utils.precision import get_autocast
+from pytorch_grad_cam.utils.precision import to_memory_format
+
+from utils.base_utils import get_block_ids
+from utils.base_utils import get_scale_transform
+from utils.trace_utils import span
+from utils.trace_utils import count
+
+
+def get_size_buckets(sizes, max_pad_ratio=0.25, max_batch_pixels=1024 * 1024):
+    """
+    Greedily groups (H, W) sizes into buckets sharing one padded shape.
+    A bucket is closed, once its padded area exceeds the real one by more
+    than max_pad_ratio, or the padded batch exceeds max_batch_pixels.
+    Returns lists of indices into sizes.
+    """
+
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][0] * sizes[i][1], sizes[i]))
+
+    buckets = []
+    bucket, bucket_h, bucket_w, bucket_area = [], 0, 0, 0
+    for i in order:
+        h, w = sizes[i]
+        new_h, new_w = max(bucket_h, h), max(bucket_w, w)
+        padded_area = (len(bucket) + 1) * new_h * new_w
+        if bucket and ((padded_area > (1. + max_pad_ratio) * (bucket_area + h * w)) or
+                       (padded_area > max_batch_pixels)):
+            buckets.append(bucket)
+            bucket, new_h, new_w, bucket_area = [], h, w, 0
+        bucket.append(i)
+        bucket_h, bucket_w, bucket_area = new_h, new_w, bucket_area + h * w
+    if bucket:
+        buckets.append(bucket)
+
+    return buckets
+
+
+def get_valid_mask(valid_sizes, shape, device=None):
+    """
+    valid_sizes: [B, 2] tensor of (H, W) of the un-padded content.
+    Returns [B, 1, H, W] float mask of the top-left valid region.
+    """
+
+    h, w = shape
+    rows = torch.arange(h, device=device)[None, :, None] < valid_sizes[:, 0, None, None]
+    cols = torch.arange(w, device=device)[None, None, :] < valid_sizes[:, 1, None, None]
+    return (rows & cols)[:, None].float()
+
+
+def get_masked_stages_stats(stages, batch_t, valid_sizes):
+    """
+    Runs padded batch_t through stages (see VGG19.get_stages) and returns,
+    for every stage, the [B, C] AvgPool[ReLU(...)] of its output over the
+    valid region only.
+
+    Masking the output of every convolution and pooling with zeros
+    reproduces the zero padding, which the un-padded image sees at its
+    border (pooling floors the valid size, so windows crossing the border
+    are dropped). Thus, the statistics are the same as for every image run
+    on its own.
+    """
+
+    x = batch_t
+    valid_sizes = valid_sizes.to(x.device)
+    mask = get_valid_mask(valid_sizes, x.shape[-2:], device=x.device)
+
+    stages_stats = []
+    for stage in stages:
+        for layer in stage:
+            x = layer(x)
+            if isinstance(layer, nn.Conv2d):
+                assert layer.stride == (1, 1) and 2 * layer.padding[0] == layer.kernel_size[0] - 1 \
+                    and 2 * layer.padding[1] == layer.kernel_size[1] - 1
+                x = x * mask
+            elif isinstance(layer, nn.MaxPool2d):
+                assert layer.padding == 0 and layer.dilation == 1 and not layer.ceil_mode
+                k, s = layer.kernel_size, layer.stride
+                valid_sizes = (valid_sizes - k) // s + 1
+                mask = get_valid_mask(valid_sizes, x.shape[-2:], device=x.device)
+                x = x * mask
+            else:
+                assert isinstance(layer, nn.ReLU)
+
+        # Reduced-precision (autocast) outputs are summed in float32.
+        blob_t = torch.relu(x.float()).sum(dim=(2, 3)) / valid_sizes.prod(dim=1, keepdim=True).float()
+        stages_stats.append(blob_t)
+
+    return stages_stats
+
+
+def get_scale_search_inblock_matrices_batched(imgs,
+                                              model,
+                                              block_ids,
+                                              scale_search_net,
+                                              max_pad_ratio=0.25,
+                                              max_batch_pixels=1024 * 1024,
+                                              use_cuda=False,
+                                              pyramids=None,
+                                              precision='fp32',
+                                              channels_last=False):
+    """
+    Batched counterpart of base_utils.get_scale_search_inblock_matrix.
+    All (image, scale) pairs are grouped into size buckets, zero-padded to
+    the bucket shape and run as one batch per bucket.
+
+    If pyramids (one per image, see pyramid_utils.PyramidCache.get) are
+    given, imgs are not used. precision and channels_last are the ones of
+    pytorch_grad_cam.utils.precision.
+
+    Returns scale_net and, for every image, a list of inblock_matrix
+    (one per block of block_ids, sorted ascending).
+    """
+
+    block_ids = [int(block_id) for block_id in get_block_ids(block_ids)]
+    stages = to_memory_format(model.eval(), channels_last).get_stages(block_ids[-1])
+
+    scale_net = list(scale_search_net.keys())
+
+    if pyramids is not None:
+        imgs = [None] * len(pyramids)
+
+    items = []
+    for img_id, img in enumerate(imgs):
+        for scale_id, (scale_curr, size_curr) in enumerate(scale_search_net.items()):
+            with span('resize', scale=scale_curr, size=size_curr):
+                if pyramids is not None:
+                    img_t = pyramids[img_id][scale_curr]
+                else:
+                    img_t = get_scale_transform(size_curr)(img)
+            items.append((img_id, scale_id, img_t))
+    sizes = [tuple(img_t.shape[-2:]) for _, _, img_t in items]
+
+    inblock_matrices = [[np.zeros((len(scale_net), 0), dtype=np.float32) for _ in block_ids]
+                        for _ in imgs]
+
+    with torch.inference_mode():
+        for bucket in tqdm(get_size_buckets(sizes, max_pad_ratio, max_batch_pixels)):
+            bucket_h = max(sizes[i][0] for i in bucket)
+            bucket_w = max(sizes[i][1] for i in bucket)
+
+            batch_t = torch.zeros((len(bucket), 3, bucket_h, bucket_w))
+            for j, i in enumerate(bucket):
+                h, w = sizes[i]
+                batch_t[j, :, :h, :w] = items[i][2]
+            valid_sizes = torch.tensor([sizes[i] for i in bucket])
+            if use_cuda:
+                batch_t = batch_t.cuda()
+            batch_t = to_memory_format(batch_t, channels_last)
+
+            with span('engine', batch=len(bucket), height=bucket_h, width=bucket_w), \
+                    get_autocast(precision, use_cuda):
+                stages_stats = get_masked_stages_stats(stages, batch_t, valid_sizes)
+            count('forward_passes', len(bucket))
+
+            for k, block_id in enumerate(block_ids):
+                blobs = stages_stats[block_id - 1].cpu().numpy()
+                count('host_bytes', blobs.nbytes)
+                for j, i in enumerate(bucket):
+                    img_id, scale_id, _ = items[i]
+                    inblock_matrix = inblock_matrices[img_id][k]
+                    if inblock_matrix.shape[1] == 0:
+                        inblock_matrix = np.zeros((len(scale_net), blobs.shape[1]), dtype=np.float32)
+                        inblock_matrices[img_id][k] = inblock_matrix
+                    inblock_matrix[scale_id] = blobs[j]
+
+    return scale_net, inblock_matrices
@@ -0,0 +1,276 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+import sys
+import time
+import threading
+import numpy as np
+from contextlib import ExitStack
+from collections import OrderedDict
+from PIL import Image
+
+import torch.multiprocessing as mp
+
+from utils.stats_utils import DEFAULT_STATS
+from utils.store_utils import ResultsStore
+from utils.trace_utils import Tracer
+from utils.pipeline_utils import get_acts_grads_engine
+from utils.pipeline_utils import estimate_image_scales
+
+
+STAGES = ['decode', 'resize', 'forward', 'backward', 'pooling', 'filtering', 'plotting', 'io']
+
+# Stage of every pipeline span (see trace_utils.span).
+SPAN_STAGES = {'read_image': 'decode',
+               'build_pyramid': 'resize',
+               'resize': 'resize',
+               'engine': 'forward',
+               'pooling': 'pooling',
+               'filter': 'filtering',
+               'plot': 'plotting',
+               'write_log': 'io'}
+
+
+def get_synthetic_images(images_dir, sizes, num_images=1, seed=0):
+    """
+    Saves num_images smooth random RGB PNGs of every (shorter side) size of
+    sizes (4:3 landscape) into images_dir. Returns {size: [image paths]}.
+    """
+
+    os.makedirs(images_dir, exist_ok=True)
+    rng = np.random.RandomState(seed)
+
+    image_paths = OrderedDict()
+    for size in sizes:
+        image_paths[size] = []
+        for i in range(num_images):
+            # Upsampled coarse noise, so that feature maps respond across scales.
+            coarse = Image.fromarray(rng.randint(0, 256, (max(size // 16, 2), max(size // 12, 2), 3), dtype=np.uint8))
+            image_path = os.path.join(images_dir, "synthetic_{0}_{1}.png".format(size, i))
+            coarse.resize((size * 4 // 3, size), Image.BICUBIC).save(image_path)
+            image_paths[size].append(image_path)
+    return image_paths
+
+
+def get_peak_rss_mb():
+    """
+    Peak resident set size of the process in MB, over its whole lifetime
+    (see run_isolated), None where the resource module is not available
+    (e.g. on Windows).
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def get_rss_mb():
+    """
+    Current resident set size of the process in MB (None where /proc is not
+    available, e.g. on macOS or Windows).
+    """
+
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class RssSampler:
+    """
+    Samples the current RSS (see get_rss_mb) every interval seconds on a
+    background thread within a with block, so that peak_mb is the peak of
+    the block only (unlike get_peak_rss_mb), and start_mb the RSS it started
+    with. Both stay None where the current RSS is not available.
+    """
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.start_mb, self.peak_mb = None, None
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def sample(self):
+        rss_mb = get_rss_mb()
+        if rss_mb is not None:
+            self.peak_mb = rss_mb if self.peak_mb is None else max(self.peak_mb, rss_mb)
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def __enter__(self):
+        self.start_mb = get_rss_mb()
+        self.sample()
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.stopped.set()
+        self.thread.join()
+        self.sample()
+
+
+def run_isolated(function, *args, **kwargs):
+    """
+    Runs function(*args, **kwargs) in a fresh spawned process and returns
+    its result, so that the peak RSS it reports is the one of this call
+    only. Models among args travel through torch multiprocessing
+    reductions (call share_memory() on them first), as in parallel_utils.
+    """
+
+    ctx = mp.get_context('spawn')
+    with ctx.Pool(processes=1) as pool:
+        return pool.apply(function, args, kwargs)
+
+
+class ForwardTimer:
+    """
+    Records wall time of every forward pass of module (e.g. the autograd
+    forward inside a GradCAM call) by forward (pre-)hooks.
+    """
+
+    def __init__(self, module):
+        self.calls = []
+        self.start = None
+        self.handles = [module.register_forward_pre_hook(self.save_start),
+                        module.register_forward_hook(self.save_seconds)]
+
+    def save_start(self, module, input):
+        self.start = time.perf_counter()
+
+    def save_seconds(self, module, input, output):
+        self.calls.append(time.perf_counter() - self.start)
+
+    def pop(self):
+        calls, self.calls = self.calls, []
+        return calls
+
+    def release(self):
+        for handle in self.handles:
+            handle.remove()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.release()
+
+
+def benchmark_image(image_path, model, block_ids, scale_search_net, res_dir,
+                    forward_timer=None,
+                    **pipeline_kwargs):
+    """
+    Runs the pipeline of an image (estimate_image_scales, as the scripts
+    do, with pipeline_kwargs) under a tracer and sums its spans (see
+    trace_utils) up per stage. With forward_timer (see ForwardTimer, on the
+    network a GradCAM acts_grads_engine runs), forward is the forward within
+    every GradCAM call and backward the rest of it.
+    Returns stage seconds and {scale: engine forward seconds}.
+    """
+
+    with Tracer() as tracer:
+        estimate_image_scales(image_path, model, block_ids, scale_search_net, base_res_dir=res_dir,
+                              **pipeline_kwargs)
+    forward_calls = [] if forward_timer is None else forward_timer.pop()
+
+    stages = OrderedDict((stage, 0.) for stage in STAGES)
+    scale_seconds = dict()
+    engine_calls = 0
+    # Spans are recorded as they end, so engine spans follow the order of the calls.
+    for event in tracer.events:
+        if (event['ph'] != 'X') or (event['name'] not in SPAN_STAGES):
+            continue
+        seconds = event['dur'] / 1e6
+        if event['name'] == 'engine':
+            if forward_timer is not None:
+                # The autograd forward of the full network; backward (and copies of the grads) is the rest.
+                stages['backward'] += seconds - forward_calls[engine_calls]
+                seconds = forward_calls[engine_calls]
+                engine_calls += 1
+            # Batched spans hold a size bucket of several scales, so they are not told apart per scale.
+            if 'scale' in event['args']:
+                scale = event['args']['scale']
+                scale_seconds[scale] = scale_seconds.get(scale, 0.) + seconds
+        stages[SPAN_STAGES[event['name']]] += seconds
+    return stages, scale_seconds
+
+
+def benchmark_blocks(image_paths, model, block_ids, scale_search_net, res_dir,
+                     engine='Activations',
+                     stats=DEFAULT_STATS,
+                     precision='fp32',
+                     channels_last=False,
+                     features_path=None,
+                     store_path=None,
+                     warmup_paths=(),
+                     **pipeline_kwargs):
+    """
+    Benchmarks block_ids (analyzed within a single sweep) over image_paths,
+    after untimed runs of warmup_paths (other images, so that the timed
+    ones are never served from the caches of the pipeline). pipeline_kwargs are the
+    ones of estimate_images_scales (see pipeline_utils.get_pipeline_kwargs);
+    with store_path, results are written into the store as well. Returns
+    {'blocks', 'images', 'images_per_sec', 'seconds_per_image', 'stages':
+    mean seconds per image, 'scales': mean engine forward seconds of every
+    scale (None for scales not told apart or not evaluated), 'peak_rss_mb':
+    sampled over the run (see RssSampler), 'peak_rss_delta_mb': its growth
+    over the RSS the run started with}. Where the current RSS is not
+    available, the peak is the one of the process (see get_peak_rss_mb), so
+    a run is meant to be the only one of its process (see run_isolated),
+    and no growth is reported.
+    """
+
+    pipeline_kwargs = dict(pipeline_kwargs, engine=engine, stats=stats, precision=precision,
+                           channels_last=channels_last, features_path=features_path)
+    with ExitStack() as stack:
+        rss_sampler = stack.enter_context(RssSampler())
+        if store_path is not None:
+            # A store connection can not cross process boundaries (see run_isolated), so the run opens its own one.
+            pipeline_kwargs['store'] = stack.enter_context(ResultsStore(store_path))
+        # Batched & Tiled engines run the model stages themselves.
+        acts_grads_engine = get_acts_grads_engine(model, block_ids, engine, stats=stats, precision=precision,
+                                                  channels_last=channels_last, features_path=features_path)
+        forward_timer = None
+        if acts_grads_engine is not None:
+            pipeline_kwargs['acts_grads_engine'] = stack.enter_context(acts_grads_engine)
+            if engine == 'GradCAM':
+                forward_timer = stack.enter_context(ForwardTimer(acts_grads_engine.model))
+
+        for image_path in warmup_paths:
+            benchmark_image(image_path, model, block_ids, scale_search_net, res_dir,
+                            forward_timer=forward_timer, **pipeline_kwargs)
+
+        stages = OrderedDict((stage, 0.) for stage in STAGES)
+        scale_seconds = dict()
+        start = time.perf_counter()
+        for image_path in image_paths:
+            image_stages, image_scale_seconds = benchmark_image(image_path, model, block_ids, scale_search_net,
+                                                                res_dir, forward_timer=forward_timer,
+                                                                **pipeline_kwargs)
+            for stage, seconds in image_stages.items():
+                stages[stage] += seconds
+            for scale, seconds in image_scale_seconds.items():
+                scale_seconds[scale] = scale_seconds.get(scale, 0.) + seconds
+        elapsed = time.perf_counter() - start
+
+    images_num = len(image_paths)
+    peak_rss_mb = get_peak_rss_mb() if rss_sampler.peak_mb is None else rss_sampler.peak_mb
+    return {'blocks': [int(block_id) for block_id in block_ids],
+            'images': images_num,
+            'images_per_sec': images_num / elapsed,
+            'seconds_per_image': elapsed / images_num,
+            'stages': OrderedDict((stage, seconds / images_num) for stage, seconds in stages.items()),
+            'scales': [{'scale': scale, 'size': size,
+                        'forward': None if scale not in scale_seconds else scale_seconds[scale] / images_num}
+                       for scale, size in scale_search_net.items()],
+            'peak_rss_mb': peak_rss_mb,
+            'peak_rss_delta_mb': None if rss_sampler.peak_mb is None else rss_sampler.peak_mb - rss_sampler.start_mb}
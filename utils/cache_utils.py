@@ -0,0 +1,78 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+import hashlib
+import numpy as np
+
+
+def get_file_hash(path, chunk_size=1 << 20):
+    sha1 = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+class ActivationStatsCache:
+    """
+    Content-addressed on-disk cache of pooled per-channel vectors (rows of
+    inblock_matrix), keyed by (image content, model, preprocessing, block,
+    statistics, input size). Every (image, model, preprocessing, block) is one NPZ file
+    holding 'sizes' [K] and 'stats' [K, C], so new scale nets only compute
+    the missing sizes and new filtering rules compute nothing at all.
+    """
+
+    def __init__(self, cache_dir, model_name='VGG19', preprocessing='pil', stats=('mean',)):
+        self.cache_dir = cache_dir
+        self.model_name = model_name
+        self.preprocessing = preprocessing
+        self.stats = tuple(stats)
+        self.image_keys = dict()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get_image_key(self, image_path):
+        stat = os.stat(image_path)
+        path_key = (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+        if path_key not in self.image_keys:
+            self.image_keys[path_key] = get_file_hash(image_path)
+        return self.image_keys[path_key]
+
+    def get_path(self, image_key, block_id):
+        # Vectors of several statistics (see stats_utils) are concatenated, the default one keeps the old name.
+        stats_suffix = '' if self.stats == ('mean',) else '_' + '-'.join(self.stats)
+        return os.path.join(self.cache_dir,
+                            image_key[:2],
+                            "{0}_{1}_{2}_block{3}{4}.npz".format(image_key, self.model_name, self.preprocessing,
+                                                                 block_id, stats_suffix))
+
+    def load(self, image_path, block_id):
+        """
+        Returns {size: [C] vector} of everything cached for the image & block.
+        """
+
+        cache_path = self.get_path(self.get_image_key(image_path), block_id)
+        if not os.path.exists(cache_path):
+            return dict()
+        with np.load(cache_path) as data:
+            return dict(zip(data['sizes'].tolist(), data['stats']))
+
+    def save(self, image_path, block_id, new_entries):
+        """
+        Merges new_entries {size: [C] vector} into the cached ones.
+        """
+
+        entries = self.load(image_path, block_id)
+        entries.update(new_entries)
+        sizes = sorted(entries.keys())
+
+        cache_path = self.get_path(self.get_image_key(image_path), block_id)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write-then-rename, so concurrent workers never read a partial file.
+        tmp_path = "{0}.{1}.tmp.npz".format(cache_path[:-len('.npz')], os.getpid())
+        np.savez(tmp_path,
+                 sizes=np.array(sizes, dtype=np.int64),
+                 stats=np.stack([entries[size] for size in sizes]).astype(np.float32))
+        os.replace(tmp_path, cache_path)
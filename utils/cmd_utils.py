@@ -20,15 +20,230 @@ def check_positive_float(value):
     return ivalue
 
 
+def add_pipeline_args(parser, block2analyze_default=('5',)):
+    parser.add_argument('--cnn', type=str, default='VGG19', choices=['VGG19', 'VGG19-int8'],
+                        help='CNN to be used in scale-estimation pipeline '
+                             '(VGG19-int8 supports the Activations engine only)', metavar='')
+    parser.add_argument('--int8_weights', type=str, default='./weights/vgg19_int8.pt',
+                        help='calibrated VGG19-int8 weights (see scale_int8_calibration.py)', metavar='')
+    parser.add_argument('--block2analyze', type=str, nargs='+', default=list(block2analyze_default),
+                        choices=['1', '2', '3', '4', '5'],
+                        help='CNN`s block(s) to be analyzed in scale-estimation pipeline '
+                             '(several blocks are analyzed within a single sweep)', metavar='')
+    parser.add_argument('--engine', type=str, default='Activations', choices=['Activations', 'Batched', 'Tiled', 'Compiled', 'TorchScript', 'ONNX', 'GradCAM'],
+                        help='feature-maps extractor: activations-only forward (no backward), '
+                             'size-bucketed batches of scales, memory-bounded overlapping tiles, '
+                             'hook-free torch.compile-d or exported TorchScript extractor, '
+                             'exported ONNX extractor run by onnxruntime (CPU), '
+                             'or full GradCAM', metavar='')
+    parser.add_argument('--features_path', type=str, default=None,
+                        help='exported extractor (see scale_features_export.py; TorchScript & ONNX engines only; '
+                             'default: ./weights/vgg19_features.pt or .onnx)', metavar='')
+    parser.add_argument('--max_memory_mb', type=check_positive_int, default=512,
+                        help='activations memory limit of a tile, in MB (Tiled engine only; '
+                             'an image fails, if a single haloed tile of the deepest block exceeds it)', metavar='')
+    parser.add_argument('--pyramid', action='store_true',
+                        help='decode & normalize an image once and resize the tensor to every scale '
+                             '(instead of resizing the PIL image per scale)')
+    parser.add_argument('--pyramid_cache_dir', type=str, default=None,
+                        help='directory to persist image pyramids between runs (implies --pyramid)', metavar='')
+    parser.add_argument('--stats_cache_dir', type=str, default=None,
+                        help='directory of the on-disk cache of pooled per-channel vectors '
+                             '(only scales missing there are run through the CNN)', metavar='')
+    parser.add_argument('--store', type=str, default=None,
+                        help='SQLite results store (per-block scales, fmap %%, merged curves and timings), '
+                             'written along with block logs; scale_tree_estimation.py reads block results from it',
+                        metavar='')
+    parser.add_argument('--stats', type=str, nargs='+', default=['mean'],
+                        choices=['mean', 'max', 'l2', 'sparsity', 'topk'],
+                        help='per-channel statistic(s) of ReLU(feature-map), computed within a single forward; '
+                             'the first one is the primary result (Activations & GradCAM engines)', metavar='')
+    parser.add_argument('--precision', type=str, default='fp32', choices=['fp32', 'bf16'],
+                        help='inference precision: float32, or bfloat16 autocast '
+                             '(feature maps are reduced in float32)', metavar='')
+    parser.add_argument('--channels_last', action='store_true',
+                        help='run the CNN in channels_last memory format')
+    parser.add_argument('--search', type=str, default='full', choices=['full', 'adaptive', 'early_exit'],
+                        help='evaluate every scale, probe a coarse subset and refine around the extrema, '
+                             'or evaluate cheap-to-expensive and stop once the decisions settle', metavar='')
+    parser.add_argument('--coarse_step', type=check_positive_int, default=4,
+                        help='step of the coarse scale subset (adaptive search only)', metavar='')
+    parser.add_argument('--patience', type=check_positive_int, default=3,
+                        help='scales without a change of the decisions and filtered feature maps '
+                             'to stop after (early_exit search only)', metavar='')
+    return parser
+
+
 def parse_args():
     parser = argparse.ArgumentParser(description='Scale-Estimation arguments', usage='%(prog)s [-h]')
 
     parser.add_argument('--image', type=str,
                         help='path to a processing image', metavar='')
-    parser.add_argument('--cnn', type=str, default='VGG19', choices=['VGG19'],
-                        help='CNN to be used in scale-estimation pipeline', metavar='')
-    parser.add_argument('--block2analyze', type=str, default='5', choices=['1', '2', '3', '4', '5'],
-                        help='CNN`s block to be analyzed in scale-estimation pipeline', metavar='')
+    add_pipeline_args(parser)
+    parser.add_argument('--check_precision', action='store_true',
+                        help='also run the float32 baseline and report the drift of the scale decisions '
+                             '(with --precision bf16 and/or --channels_last)')
+    parser.add_argument('--trace', type=str, default=None,
+                        help='save a Chrome-trace JSON of the pipeline spans and counters', metavar='')
+    parser.add_argument('--trace_torch', action='store_true',
+                        help='record the run with torch.profiler and save its trace (with the spans) to --trace')
+    parser.add_argument('--no_plots', '--no-plots', dest='no_plots', action='store_true',
+                        help='write block logs only, without PNG plots (matplotlib is not loaded)')
+
+    args = parser.parse_args()
+    # onnxruntime runs the graph in float32 whatever --precision is, so there is no drift to check.
+    if args.check_precision and (args.engine == 'ONNX'):
+        parser.error('--check_precision is not supported by the ONNX engine')
+    return args
+
+
+def parse_tree_args():
+    parser = argparse.ArgumentParser(description='Scale-Tree-Estimation arguments', usage='%(prog)s [-h]')
+
+    parser.add_argument('--image', type=str,
+                        help='path to a processed image', metavar='')
+    parser.add_argument('--store', type=str, default=None,
+                        help='SQLite results store to read block results from, instead of block logs', metavar='')
+    parser.add_argument('--stats', type=str, nargs='+', default=None,
+                        choices=['mean', 'max', 'l2', 'sparsity', 'topk'],
+                        help='per-channel statistic whose results are read from --store (the first one, if several); '
+                             'default: the primary statistic every image was processed with', metavar='')
+    parser.add_argument('--bulk', action='store_true',
+                        help='aggregate tree solutions of every image at once, rewriting dataset_log.csv, '
+                             'and save dataset histograms')
+    parser.add_argument('--no_plots', '--no-plots', dest='no_plots', action='store_true',
+                        help='write dataset_log.csv only, without PNG plots (matplotlib is not loaded)')
+
+    args = parser.parse_args()
+    if (args.image is None) and (not args.bulk):
+        parser.error('either --image or --bulk is required')
+    return args
+
+
+def parse_server_args():
+    parser = argparse.ArgumentParser(description='Scale-Estimation server arguments', usage='%(prog)s [-h]')
+
+    add_pipeline_args(parser, block2analyze_default=('1', '2', '3', '4', '5'))
+    parser.add_argument('--host', type=str, default='127.0.0.1',
+                        help='host to listen on (with --port)', metavar='')
+    parser.add_argument('--port', type=int, default=0,
+                        help='TCP port to listen on; 0 reads jobs from stdin', metavar='')
+    parser.add_argument('--res_dir', type=str, default='./results',
+                        help='base directory for per-image results', metavar='')
+    parser.add_argument('--plots', action='store_true',
+                        help='save per-block PNG plots along with block logs')
+
+    args = parser.parse_args()
+    return args
+
+
+def parse_dataset_args():
+    parser = argparse.ArgumentParser(description='Scale-Estimation dataset arguments', usage='%(prog)s [-h]')
+
+    parser.add_argument('--images_dir', type=str, default=None,
+                        help='directory with images to be processed', metavar='')
+    parser.add_argument('--image_list', type=str, default=None,
+                        help='text file with one image path per line (relative paths are resolved against --images_dir)',
+                        metavar='')
+    parser.add_argument('--glob', type=str, default='*',
+                        help='file-name pattern of images to be processed', metavar='')
+    add_pipeline_args(parser, block2analyze_default=('1', '2', '3', '4', '5'))
+    parser.add_argument('--images_per_batch', type=check_positive_int, default=1,
+                        help='images sharing size buckets (Batched engine only)', metavar='')
+    parser.add_argument('--res_dir', type=str, default='./results',
+                        help='base directory for per-image results and dataset_log.csv', metavar='')
+    parser.add_argument('--plots', action='store_true',
+                        help='save per-block and tree PNG plots')
+    parser.add_argument('--no_resume', action='store_true',
+                        help='process images, which are already present in dataset_log.csv, again')
+    parser.add_argument('--workers', type=check_positive_int, default=1,
+                        help='number of worker processes sharing the CNN weights', metavar='')
+    parser.add_argument('--threads_per_worker', type=check_positive_int, default=None,
+                        help='intra-op threads per worker (default: CPU count / workers)', metavar='')
+
+    args = parser.parse_args()
+    if (args.images_dir is None) and (args.image_list is None):
+        parser.error('either --images_dir or --image_list is required')
+    return args
+
+
+def parse_calibration_args():
+    parser = argparse.ArgumentParser(description='VGG19-int8 calibration arguments', usage='%(prog)s [-h]')
+
+    parser.add_argument('--images_dir', type=str, required=True,
+                        help='directory with calibration images', metavar='')
+    parser.add_argument('--glob', type=str, default='*',
+                        help='file-name pattern of calibration images', metavar='')
+    parser.add_argument('--num_images', type=check_positive_int, default=32,
+                        help='number of calibration images', metavar='')
+    parser.add_argument('--calib_scales', type=float, nargs='+', default=[-2.0, 0, 2.0],
+                        help='input scales every calibration image is run at', metavar='')
+    parser.add_argument('--backend', type=str, default='fbgemm', choices=['fbgemm', 'qnnpack'],
+                        help='quantized engine: fbgemm (x86) or qnnpack (ARM)', metavar='')
+    parser.add_argument('--int8_weights', type=str, default='./weights/vgg19_int8.pt',
+                        help='path to save the calibrated weights to', metavar='')
+
+    args = parser.parse_args()
+    return args
+
+
+def parse_benchmark_args():
+    parser = argparse.ArgumentParser(description='Scale-Estimation benchmark arguments', usage='%(prog)s [-h]')
+
+    parser.add_argument('--sizes', type=check_positive_int, nargs='+', default=[224, 512],
+                        help='shorter sides of the synthetic (4:3) images', metavar='')
+    parser.add_argument('--num_images', type=check_positive_int, default=2,
+                        help='timed synthetic images per size', metavar='')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='untimed images per run (first calls, allocator, compilation), '
+                             'other than the timed ones', metavar='')
+    # Every block of --block2analyze is benchmarked alone, then all of them within a single sweep.
+    add_pipeline_args(parser, block2analyze_default=('1', '2', '3', '4', '5'))
+    parser.add_argument('--no_plots', '--no-plots', dest='no_plots', action='store_true',
+                        help='skip (and do not time) the plotting stage')
+    parser.add_argument('--work_dir', type=str, default='./benchmark',
+                        help='directory for the synthetic images and the results written while benchmarking',
+                        metavar='')
+    parser.add_argument('--json', type=str, default='./benchmark/benchmark.json',
+                        help='path to save the benchmark results to', metavar='')
+    parser.add_argument('--tag', type=str, default='',
+                        help='label of the run (e.g. version) stored in the JSON', metavar='')
+
+    args = parser.parse_args()
+    return args
+
+
+def parse_agreement_args():
+    parser = argparse.ArgumentParser(description='Block-logs agreement arguments', usage='%(prog)s [-h]')
+
+    parser.add_argument('--ref_res_dir', type=str, default='./results',
+                        help='base directory of the reference (float32) per-image results', metavar='')
+    parser.add_argument('--res_dir', type=str,
+                        help='base directory of the compared (e.g. VGG19-int8) per-image results', metavar='')
+    parser.add_argument('--csv', type=str, default=None,
+                        help='path to save per-image, per-block comparison to', metavar='')
+
+    args = parser.parse_args()
+    return args
+
+
+def parse_export_args():
+    parser = argparse.ArgumentParser(description='Feature-extractor export arguments', usage='%(prog)s [-h]')
+
+    parser.add_argument('--block2analyze', type=str, nargs='+', default=['1', '2', '3', '4', '5'],
+                        choices=['1', '2', '3', '4', '5'],
+                        help='CNN`s block(s) the extractor returns', metavar='')
+    parser.add_argument('--format', type=str, default='TorchScript', choices=['TorchScript', 'ONNX'],
+                        help='export format of the extractor', metavar='')
+    parser.add_argument('--full_maps', action='store_true',
+                        help='return full block outputs instead of pooled ReLU means '
+                             '(needed for statistics other than mean)')
+    parser.add_argument('--features_path', type=str, default=None,
+                        help='path to save the extractor to (default: ./weights/vgg19_features.pt or .onnx)',
+                        metavar='')
+    parser.add_argument('--check', action='store_true',
+                        help='compare the exported ONNX extractor (onnxruntime) with the eager one '
+                             'upon every size of the scale-search net')
 
     args = parser.parse_args()
     return args
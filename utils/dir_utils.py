@@ -4,6 +4,8 @@
 
 
 import os
+import glob
+import fnmatch
 import shutil
 
 
@@ -34,3 +36,18 @@ def create_folder(folder, force=False, raise_except_if_exists=True):
                 raise Exception('utils/dir_utils.py: '
                                 'def create_folder(...): '
                                 'error: directory {} exists. In order to overwrite it set force=True'.format(folder))
+
+
+def get_image_paths(images_dir=None, image_list=None, pattern='*'):
+    """
+    Image paths either listed in image_list (one per line, relative ones are
+    resolved against images_dir) or found in images_dir, filtered by pattern.
+    """
+    if image_list is not None:
+        with open(image_list, 'rt') as f:
+            image_paths = [line.strip() for line in f if line.strip()]
+        if images_dir is not None:
+            image_paths = [os.path.join(images_dir, p) for p in image_paths]
+        return [p for p in image_paths if fnmatch.fnmatch(os.path.split(p)[-1], pattern)]
+
+    return sorted(p for p in glob.glob(os.path.join(images_dir, pattern)) if os.path.isfile(p))
@@ -0,0 +1,193 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import numpy as np
+
+import torch
+
+from pytorch_grad_cam.utils.precision import get_autocast
+from pytorch_grad_cam.utils.precision import to_memory_format
+
+from models.vgg19 import VGG19Features
+from utils.base_utils import get_block_ids
+
+
+FEATURES_PATHS = {
+    'TorchScript': './weights/vgg19_features.pt',
+    'ONNX': './weights/vgg19_features.onnx'
+}
+
+
+def get_features_path(engine, features_path=None):
+    return FEATURES_PATHS[engine] if features_path is None else features_path
+
+
+def export_features(model, block_ids, features_path, pooled=True):
+    """
+    Scripts VGG19Features of model and saves it as TorchScript, which is
+    loaded (see load_features) without the Python model definition.
+    """
+
+    block_ids = get_block_ids(block_ids)
+    features = torch.jit.script(VGG19Features(model.eval(), block_ids, pooled=pooled).eval())
+    torch.jit.save(features, features_path,
+                   _extra_files={'block_ids': ','.join(block_ids), 'pooled': str(int(pooled))})
+    return features
+
+
+def load_features(features_path):
+    """
+    Returns the TorchScript features, their block_ids and pooled flag.
+    """
+
+    extra_files = {'block_ids': '', 'pooled': ''}
+    features = torch.jit.load(features_path, map_location='cpu', _extra_files=extra_files)
+    block_ids = extra_files['block_ids'].decode('utf-8').split(',')
+    pooled = bool(int(extra_files['pooled'].decode('utf-8')))
+    return features.eval(), block_ids, pooled
+
+
+def export_features_onnx(model, block_ids, features_path, pooled=True, opset_version=17):
+    """
+    Exports VGG19Features of model to ONNX with dynamic batch & spatial axes
+    (so a single graph serves every size of a scale net). Block outputs are
+    graph outputs named block<N> (or block<N>_mean, reduced in-graph to
+    per-channel ReLU means, with pooled=True).
+    """
+
+    block_ids = get_block_ids(block_ids)
+    features = VGG19Features(model.eval(), block_ids, pooled=pooled).eval()
+
+    output_names = ["block{0}{1}".format(block_id, '_mean' if pooled else '') for block_id in block_ids]
+    dynamic_axes = {'input': {0: 'batch', 2: 'height', 3: 'width'}}
+    for block_id, output_name in zip(block_ids, output_names):
+        dynamic_axes[output_name] = {0: 'batch'} if pooled else {0: 'batch',
+                                                                 2: 'height{}'.format(block_id),
+                                                                 3: 'width{}'.format(block_id)}
+
+    with torch.inference_mode():
+        torch.onnx.export(features, (torch.zeros((1, 3, 224, 224)),), features_path,
+                          input_names=['input'],
+                          output_names=output_names,
+                          dynamic_axes=dynamic_axes,
+                          opset_version=opset_version,
+                          dynamo=False)
+    return output_names
+
+
+def get_compiled_features(model, block_ids, pooled=True):
+    # Input sizes change from scale to scale, so shapes are compiled as dynamic ones.
+    return torch.compile(VGG19Features(model.eval(), block_ids, pooled=pooled).eval(), dynamic=True)
+
+
+class FeaturesEngine:
+    """
+    acts_grads_engine (see base_utils.get_scale_search_inblock_matrix) upon
+    a hook-free multi-output extractor (VGG19Features: scripted, loaded or
+    compiled), covering features_block_ids. Returns the outputs of block_ids
+    only and no grads.
+    """
+
+    def __init__(self, features, features_block_ids, block_ids,
+                 use_cuda=False,
+                 precision='fp32',
+                 channels_last=False):
+        features_block_ids = get_block_ids(features_block_ids)
+        block_ids = get_block_ids(block_ids)
+        missing = [block_id for block_id in block_ids if block_id not in features_block_ids]
+        if missing:
+            raise ValueError("features cover blocks {0} only, got: {1}".format(features_block_ids, block_ids))
+
+        self.features = features
+        self.output_ids = [features_block_ids.index(block_id) for block_id in block_ids]
+        self.cuda = use_cuda
+        if self.cuda:
+            self.features = self.features.cuda()
+        self.precision = precision
+        self.channels_last = channels_last
+
+    def __call__(self, input_tensor, targets=None):
+        if self.cuda:
+            input_tensor = input_tensor.cuda()
+        input_tensor = to_memory_format(input_tensor, self.channels_last)
+
+        with torch.inference_mode(), get_autocast(self.precision, self.cuda):
+            outputs = self.features(input_tensor)
+        return [outputs[i].float().cpu().numpy() for i in self.output_ids], []
+
+    def release(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.release()
+
+
+class OnnxFeaturesEngine:
+    """
+    acts_grads_engine (see base_utils.get_scale_search_inblock_matrix) upon
+    an onnxruntime CPU session of an exported extractor (see
+    export_features_onnx). Returns the outputs of block_ids only and no grads.
+    onnxruntime keeps its own thread pool: intra_op_num_threads of 0 takes
+    every core, so processes sharing the machine pin their share.
+    """
+
+    def __init__(self, features_path, block_ids, intra_op_num_threads=0):
+        # onnxruntime is an optional dependency of the ONNX engine only.
+        import onnxruntime as ort
+
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sess_options.intra_op_num_threads = intra_op_num_threads
+        self.session = ort.InferenceSession(features_path, sess_options=sess_options,
+                                            providers=['CPUExecutionProvider'])
+
+        outputs = {output.name[len('block'):].split('_')[0]: output.name for output in self.session.get_outputs()}
+        self.pooled = all(name.endswith('_mean') for name in outputs.values())
+        block_ids = get_block_ids(block_ids)
+        missing = [block_id for block_id in block_ids if block_id not in outputs]
+        if missing:
+            raise ValueError("{0} covers blocks {1} only, got: {2}".format(features_path,
+                                                                           get_block_ids(outputs),
+                                                                           block_ids))
+        self.output_names = [outputs[block_id] for block_id in block_ids]
+        self.input_name = self.session.get_inputs()[0].name
+
+    def __call__(self, input_tensor, targets=None):
+        outputs = self.session.run(self.output_names, {self.input_name: input_tensor.cpu().numpy()})
+        return [output.astype(np.float32) for output in outputs], []
+
+    def release(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.release()
+
+
+def check_features_onnx(features_path, model, block_ids, scale_search_net):
+    """
+    Runs the exported extractor (onnxruntime) and the eager one on a random
+    input of every size of scale_search_net (shorter side, square inputs).
+    Returns {size: max relative error over block outputs}.
+    """
+
+    block_ids = get_block_ids(block_ids)
+    engine = OnnxFeaturesEngine(features_path, block_ids)
+    features = VGG19Features(model.eval(), block_ids, pooled=engine.pooled).eval()
+
+    errors = dict()
+    for size in scale_search_net.values():
+        input_tensor = torch.randn((1, 3, size, size))
+        with torch.inference_mode():
+            ref_outputs = [output.numpy() for output in features(input_tensor)]
+        outputs, _ = engine(input_tensor)
+        errors[size] = max(float(np.abs(output - ref_output).max() / max(np.abs(ref_output).max(), 1e-12))
+                           for output, ref_output in zip(outputs, ref_outputs))
+    return errors
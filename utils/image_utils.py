@@ -4,7 +4,9 @@
 
 
 import numpy as np
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.trace_utils import span
 
 
 def touint8(img):
@@ -27,26 +29,42 @@ def centered_norm(img):
     return (img - np.median(img)) / np.std(img)
 
 
+def get_figure():
+    """
+    A figure drawn by the Agg canvas, whatever the pyplot backend is. It is
+    not registered with pyplot, so it is freed as soon as it is dropped, and
+    it can be drawn from any thread.
+    """
+
+    # matplotlib is imported on demand, runs without plots never load it.
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
 def plot_line(x_values, y_values, save_path="tmp_plot_line.png",
               x_label='',
               y_label='',
               title='',
               grid=True,
               legend=False):
-    fig = plt.figure()
-    fig, ax = plt.subplots()
-
-    ax.plot(x_values, y_values, "-o")
-    if grid:
-        ax.grid()
-    ax.set(xlabel=x_label,
-           ylabel=y_label,
-           title=title)
-    if legend:
-        ax.legend()
-    plt.tight_layout()
-    if save_path:
-        fig.savefig(save_path)
+    with span('plot', path=save_path):
+        fig, ax = get_figure()
+
+        ax.plot(x_values, y_values, "-o")
+        if grid:
+            ax.grid()
+        ax.set(xlabel=x_label,
+               ylabel=y_label,
+               title=title)
+        if legend:
+            ax.legend()
+        fig.tight_layout()
+        if save_path:
+            fig.savefig(save_path)
 
 
 def plot_scatter(x_values, y_values, save_path="tmp_plot_scatter.png",
@@ -57,26 +75,61 @@ def plot_scatter(x_values, y_values, save_path="tmp_plot_scatter.png",
                  legend=True,
                  x_lim=None,
                  y_lim=None):
-    fig = plt.figure()
-    fig, ax = plt.subplots()
-
-    ax.scatter(x_values, y_values)
-    ax.plot(np.arange(x_lim[0], x_lim[1] + 1),
-            [np.mean(y_values)]*(x_lim[1] - x_lim[0] + 1),
-            color='orange', label='optimal scale')
-    if grid:
-        ax.grid()
-    ax.set(xlabel=x_label,
-           ylabel=y_label,
-           title=title)
-    if legend:
-        ax.legend()
-    if x_lim:
-        assert isinstance(x_lim, tuple) and (len(x_lim) == 2)
-        plt.xlim(*x_lim)
-    if y_lim:
-        assert isinstance(y_lim, tuple) and (len(y_lim) == 2)
-        plt.ylim(*y_lim)
-    plt.tight_layout()
-    if save_path:
-        fig.savefig(save_path)
+    with span('plot', path=save_path):
+        fig, ax = get_figure()
+
+        ax.scatter(x_values, y_values)
+        ax.plot(np.arange(x_lim[0], x_lim[1] + 1),
+                [np.mean(y_values)]*(x_lim[1] - x_lim[0] + 1),
+                color='orange', label='optimal scale')
+        if grid:
+            ax.grid()
+        ax.set(xlabel=x_label,
+               ylabel=y_label,
+               title=title)
+        if legend:
+            ax.legend()
+        if x_lim:
+            assert isinstance(x_lim, tuple) and (len(x_lim) == 2)
+            ax.set_xlim(*x_lim)
+        if y_lim:
+            assert isinstance(y_lim, tuple) and (len(y_lim) == 2)
+            ax.set_ylim(*y_lim)
+        fig.tight_layout()
+        if save_path:
+            fig.savefig(save_path)
+
+
+class PlotRenderer:
+    """
+    Renders plots (plot_line, plot_scatter, ... calls) on background threads,
+    off the critical path of the caller. Figures are Agg ones (see
+    get_figure), so the threads share no pyplot state. An exception of a
+    plot is raised by wait() / close(), which block until every submitted
+    plot is saved.
+    """
+
+    def __init__(self, workers=1):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='plot')
+        self.futures = []
+
+    def submit(self, plot_fn, *args, **kwargs):
+        self.futures = [future for future in self.futures if not future.done() or future.exception()]
+        self.futures.append(self.executor.submit(plot_fn, *args, **kwargs))
+
+    def wait(self):
+        futures, self.futures = self.futures, []
+        for future in futures:
+            future.result()
+
+    def close(self):
+        try:
+            self.wait()
+        finally:
+            self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
@@ -0,0 +1,90 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import torch
+import torch.multiprocessing as mp
+
+from utils.pipeline_utils import get_acts_grads_engine
+from utils.pipeline_utils import estimate_images_scales
+from utils.store_utils import ResultsStore
+
+
+_worker = dict()
+
+
+def init_worker(model, block_ids, scale_search_net, threads_per_worker, pipeline_kwargs, store_path=None):
+    """
+    Runs once in every worker process. model arrives through torch
+    multiprocessing reductions, so its weights stay in shared memory
+    (exported engines load their own extractor, with no model).
+    With store_path, the worker writes into its own connection of the
+    results store. Either store is committed once per chunk.
+    """
+
+    torch.set_num_threads(threads_per_worker)
+    if store_path is not None:
+        pipeline_kwargs = dict(pipeline_kwargs, store=ResultsStore(store_path, batch_size=float('inf')))
+    _worker['model'] = model
+    _worker['block_ids'] = block_ids
+    _worker['scale_search_net'] = scale_search_net
+    _worker['pipeline_kwargs'] = dict(pipeline_kwargs,
+                                      acts_grads_engine=get_acts_grads_engine(model, block_ids,
+                                                                              pipeline_kwargs.get('engine',
+                                                                                                  'Activations'),
+                                                                              stats=pipeline_kwargs.get('stats',
+                                                                                                        ('mean',)),
+                                                                              precision=pipeline_kwargs.get(
+                                                                                  'precision', 'fp32'),
+                                                                              channels_last=pipeline_kwargs.get(
+                                                                                  'channels_last', False),
+                                                                              features_path=pipeline_kwargs.get(
+                                                                                  'features_path'),
+                                                                              threads=threads_per_worker))
+
+
+def process_chunk(chunk):
+    store = _worker['pipeline_kwargs'].get('store')
+    try:
+        summaries = estimate_images_scales(chunk, _worker['model'], _worker['block_ids'], _worker['scale_search_net'],
+                                           **_worker['pipeline_kwargs'])
+        # Committed before the chunk is logged as done, so a resumed run never skips unstored images.
+        if store is not None:
+            store.flush()
+    except Exception as e:
+        return chunk, None, str(e)
+    return chunk, summaries, None
+
+
+def imap_chunks(chunks, model, block_ids, scale_search_net,
+                workers=1,
+                threads_per_worker=1,
+                **pipeline_kwargs):
+    """
+    Yields (chunk, summaries, error) for every chunk of image paths in the
+    order of chunks, whichever worker processed it, so results are merged
+    deterministically. pipeline_kwargs go to estimate_images_scales.
+    """
+
+    if workers <= 1:
+        init_worker(model, block_ids, scale_search_net, threads_per_worker, pipeline_kwargs)
+        for chunk in chunks:
+            yield process_chunk(chunk)
+        return
+
+    # Worker processes plot in place: a renderer can not cross process boundaries
+    # (and plotting is already parallel with the other workers' forward passes).
+    # Neither can a store connection, so every worker opens its own one and
+    # commits a chunk before returning it (pool workers are terminated on exit).
+    store = pipeline_kwargs.get('store')
+    pipeline_kwargs = dict(pipeline_kwargs, renderer=None, store=None)
+    if model is not None:
+        model.share_memory()
+    ctx = mp.get_context('spawn')
+    with ctx.Pool(processes=workers,
+                  initializer=init_worker,
+                  initargs=(model, block_ids, scale_search_net, threads_per_worker, pipeline_kwargs,
+                            None if store is None else store.path)) as pool:
+        for result in pool.imap(process_chunk, chunks):
+            yield result
@@ -0,0 +1,536 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+import time
+import numpy as np
+from functools import partial
+from collections import OrderedDict
+from PIL import Image
+
+import torch
+
+from pytorch_grad_cam.activations_extractor import ActivationsExtractor
+from pytorch_grad_cam.utils.precision import to_memory_format
+
+from utils.dir_utils import create_folder
+from utils.image_utils import plot_line
+
+from models.vgg19 import VGG19
+from models.vgg19_int8 import VGG19Int8
+from utils.base_utils import get_scale_search_net
+from utils.base_utils import get_block_ids
+from utils.base_utils import get_scale_search_inblock_matrix
+from utils.base_utils import get_filtered_inblock_matrix
+from utils.base_utils import get_block_scale
+from utils.batch_utils import get_scale_search_inblock_matrices_batched
+from utils.tile_utils import get_scale_search_inblock_matrix_tiled
+from utils.pyramid_utils import PyramidCache
+from utils.cache_utils import ActivationStatsCache
+from utils.cache_utils import get_file_hash
+from utils.search_utils import get_adaptive_inblock_matrices
+from utils.search_utils import get_early_exit_inblock_matrices
+from utils.stats_utils import DEFAULT_STATS
+from utils.stats_utils import get_channel_stats
+from utils.stats_utils import split_stats_inblock_matrix
+from utils.export_utils import FeaturesEngine
+from utils.export_utils import OnnxFeaturesEngine
+from utils.export_utils import get_features_path
+from utils.export_utils import load_features
+from utils.export_utils import get_compiled_features
+from utils.tree_utils import get_image_name
+from utils.trace_utils import span
+
+
+SCALE_NET = [-3.0,
+             -2.75, -2.5, -2.25, -2.0,
+             -1.75, -1.5, -1.25,
+             0,
+             1.25, 1.5, 1.75, 2.0,
+             2.25, 2.5, 2.75, 3.0,
+             3.25, 3.5, 3.75, 4.0]
+
+# Engines running an extractor exported by scale_features_export.py, without the Python model.
+EXPORTED_ENGINES = ['TorchScript', 'ONNX']
+
+
+def get_default_scale_search_net(original_size=224):
+    return get_scale_search_net(scale_net=SCALE_NET, original_size=original_size)
+
+
+def get_model(cnn='VGG19', int8_weights='./weights/vgg19_int8.pt'):
+    model = None
+    if cnn == 'VGG19':
+        model = VGG19()
+    elif cnn == 'VGG19-int8':
+        # Calibrated by scale_int8_calibration.py.
+        model = VGG19Int8.load(int8_weights)
+    return model
+
+
+def get_engine_model(args):
+    """
+    Builds the CNN of args, unless args.engine runs an exported extractor
+    (see EXPORTED_ENGINES), which holds its own weights: then None.
+    """
+
+    if args.engine in EXPORTED_ENGINES:
+        if args.cnn != 'VGG19':
+            raise ValueError("{0} engine runs an exported VGG19 extractor, got: {1}".format(args.engine, args.cnn))
+        return None
+    return get_model(args.cnn, int8_weights=args.int8_weights)
+
+
+def get_res_dir(image_path, base_res_dir="./results"):
+    return os.path.join(base_res_dir, get_image_name(image_path))
+
+
+def get_acts_grads_engine(model, block_ids, engine='Activations', stats=DEFAULT_STATS,
+                          precision='fp32', channels_last=False, features_path=None, threads=None):
+    block_ids = get_block_ids(block_ids)
+
+    acts_grads_engine = None
+    if engine in ['Activations', 'GradCAM']:
+        # Hook-based engines only; model is None for exported ones (see get_engine_model).
+        target_layers = [model.__getattr__("block{}".format(block_id))[-1] for block_id in block_ids]
+
+    if engine == 'Activations':
+        # No classifier output is needed, so stop right after the deepest analyzed block.
+        # Hooks keep per-channel statistics only, no full feature-map copies.
+        acts_grads_engine = ActivationsExtractor(model=model.get_truncated(int(block_ids[-1])),
+                                                 target_layers=target_layers,
+                                                 reduce=partial(get_channel_stats, stats=tuple(stats)),
+                                                 precision=precision,
+                                                 channels_last=channels_last)
+    elif engine == 'GradCAM':
+        # GradCAM (BaseCAM) pulls in ttach & cv2, which the other engines do not need.
+        from pytorch_grad_cam.grad_cam import GradCAM
+        acts_grads_engine = GradCAM(model=model, target_layers=target_layers,
+                                    precision=precision, channels_last=channels_last)
+    elif engine == 'Compiled':
+        # Pooled outputs cover the default statistic, any other one is computed from the full maps.
+        features = get_compiled_features(to_memory_format(model, channels_last), block_ids,
+                                         pooled=(tuple(stats) == DEFAULT_STATS))
+        acts_grads_engine = FeaturesEngine(features, block_ids, block_ids,
+                                           precision=precision, channels_last=channels_last)
+    elif engine == 'TorchScript':
+        # Exported by scale_features_export.py, no Python model definition is needed.
+        features_path = get_features_path(engine, features_path)
+        features, features_block_ids, pooled = load_features(features_path)
+        if pooled and (tuple(stats) != DEFAULT_STATS):
+            raise ValueError("{0} holds pooled {1} statistics only, got: {2}".format(features_path, DEFAULT_STATS,
+                                                                                     tuple(stats)))
+        acts_grads_engine = FeaturesEngine(to_memory_format(features, channels_last), features_block_ids, block_ids,
+                                           precision=precision, channels_last=channels_last)
+    elif engine == 'ONNX':
+        # onnxruntime (CPU) runs the graph in its own precision & layout, and in its own thread pool,
+        # which is pinned to threads (the ones of torch, by default), so that workers do not oversubscribe.
+        features_path = get_features_path(engine, features_path)
+        acts_grads_engine = OnnxFeaturesEngine(features_path, block_ids,
+                                               intra_op_num_threads=torch.get_num_threads() if threads is None
+                                               else threads)
+        if acts_grads_engine.pooled and (tuple(stats) != DEFAULT_STATS):
+            raise ValueError("{0} holds pooled {1} statistics only, got: {2}".format(features_path, DEFAULT_STATS,
+                                                                                     tuple(stats)))
+    return acts_grads_engine
+
+
+def get_pyramid_cache(args):
+    if args.pyramid or (args.pyramid_cache_dir is not None):
+        return PyramidCache(cache_dir=args.pyramid_cache_dir)
+    return None
+
+
+def get_model_name(args):
+    # Calibrated weights are told apart by content, so recalibrated or swapped files never reuse old entries.
+    if args.cnn == 'VGG19-int8':
+        return '{0}-{1}'.format(args.cnn, get_file_hash(args.int8_weights)[:12])
+    return args.cnn
+
+
+def get_stats_cache(args):
+    if args.stats_cache_dir is not None:
+        preprocessing = 'pil' if get_pyramid_cache(args) is None else 'pyramid-uint8'
+        if args.precision != 'fp32':
+            preprocessing += '-' + args.precision
+        return ActivationStatsCache(args.stats_cache_dir, model_name=get_model_name(args),
+                                    preprocessing=preprocessing, stats=tuple(args.stats))
+    return None
+
+
+def get_pipeline_kwargs(args):
+    """
+    Pipeline options of add_pipeline_args as estimate_images_scales kwargs.
+    """
+
+    return {'engine': args.engine,
+            'pyramid_cache': get_pyramid_cache(args),
+            'stats_cache': get_stats_cache(args),
+            'search': args.search,
+            'coarse_step': args.coarse_step,
+            'patience': args.patience,
+            'max_memory_mb': args.max_memory_mb,
+            'stats': tuple(args.stats),
+            'precision': args.precision,
+            'channels_last': args.channels_last,
+            'features_path': args.features_path}
+
+
+def check_engine(model, engine, stats, precision='fp32', channels_last=False):
+    # onnxruntime runs the graph in its own precision & layout, so results would be cached & reported as bf16 wrongly.
+    if (engine == 'ONNX') and ((precision != 'fp32') or channels_last):
+        raise ValueError("{0} engine supports fp32 precision in the default memory format only, "
+                         "got: {1}{2}".format(engine, precision, ", channels_last" if channels_last else ""))
+    # Masked (Batched) and tiled reductions are implemented for the mean only.
+    if (engine in ['Batched', 'Tiled']) and (tuple(stats) != DEFAULT_STATS):
+        raise ValueError("{0} engine supports {1} statistics only, got: {2}".format(engine, DEFAULT_STATS,
+                                                                                 tuple(stats)))
+    # Quantized models have neither a classifier nor gradients, nor float layers.
+    if getattr(model, 'QUANTIZED', False) and (engine != 'Activations'):
+        raise ValueError("{0} supports the Activations engine only, got: {1}".format(type(model).__name__,
+                                                                                   engine))
+
+
+def get_inblock_matrices(img, model, block_ids, scale_search_net,
+                         engine='Activations',
+                         acts_grads_engine=None,
+                         pyramid=None,
+                         max_memory_mb=512,
+                         stats=DEFAULT_STATS,
+                         precision='fp32',
+                         channels_last=False,
+                         features_path=None):
+    """
+    Returns scale_net and one inblock_matrix per block of block_ids (sorted ascending),
+    holding the statistics of stats concatenated along fmaps (see split_stats_inblock_matrix).
+    acts_grads_engine (see get_acts_grads_engine, built with the same stats) is built on the fly, if not given.
+    max_memory_mb bounds the activations of the 'Tiled' engine. precision ('fp32' or 'bf16' autocast)
+    and channels_last are the ones of pytorch_grad_cam.utils.precision. features_path is the exported
+    extractor of the 'TorchScript' engine.
+    """
+
+    block_ids = get_block_ids(block_ids)
+    check_engine(model, engine, stats, precision, channels_last)
+
+    if engine == 'Batched':
+        scale_net, inblock_matrices = get_scale_search_inblock_matrices_batched([img], model, block_ids,
+                                                                                scale_search_net,
+                                                                                pyramids=None if pyramid is None
+                                                                                else [pyramid],
+                                                                                precision=precision,
+                                                                                channels_last=channels_last)
+        return scale_net, inblock_matrices[0]
+    elif engine == 'Tiled':
+        return get_scale_search_inblock_matrix_tiled(img, model, block_ids, scale_search_net,
+                                                     max_memory_mb=max_memory_mb,
+                                                     pyramid=pyramid,
+                                                     precision=precision,
+                                                     channels_last=channels_last)
+
+    if acts_grads_engine is None:
+        with get_acts_grads_engine(model, block_ids, engine, stats=stats,
+                                   precision=precision, channels_last=channels_last,
+                                   features_path=features_path) as acts_grads_engine:
+            return get_scale_search_inblock_matrix(img, acts_grads_engine, scale_search_net,
+                                                   pyramid=pyramid, stats=stats)
+    return get_scale_search_inblock_matrix(img, acts_grads_engine, scale_search_net, pyramid=pyramid, stats=stats)
+
+
+def get_block_result(scale_net, inblock_matrix):
+    with span('filter', fmaps=inblock_matrix.shape[1]):
+        fmap_save, filtered_inblock_matrix = get_filtered_inblock_matrix(inblock_matrix)
+        filtered_merged_inblock_matrix = np.mean(filtered_inblock_matrix, axis=1)
+
+    return {
+        'inblock_matrix': inblock_matrix,
+        'fmap_save': fmap_save,
+        'fmap_save_perc': len(fmap_save) / inblock_matrix.shape[1] * 100,
+        'filtered_inblock_matrix': filtered_inblock_matrix,
+        'filtered_merged_inblock_matrix': filtered_merged_inblock_matrix,
+        'scale': get_block_scale(scale_net, filtered_merged_inblock_matrix)
+    }
+
+
+def save_block_result(res_dir, block_id, scale_net, block_result, plots=True, renderer=None):
+    """
+    Writes the block log (synchronously) and, with plots, the block PNGs:
+    through renderer (see image_utils.PlotRenderer), if given, or in place.
+    """
+
+    create_folder(res_dir, force=False, raise_except_if_exists=False)
+
+    if plots:
+        draw = plot_line if renderer is None else partial(renderer.submit, plot_line)
+        for suffix, key in [('', 'inblock_matrix'),
+                            ('_filtered', 'filtered_inblock_matrix'),
+                            ('_filtered_merged', 'filtered_merged_inblock_matrix')]:
+            draw(x_values=scale_net,
+                 y_values=block_result[key],
+                 x_label="Input scale: \n2 means x2-UpSample, \n -2 means x2-DownSample",
+                 y_label="AvgPool[ReLU(...)]",
+                 save_path=os.path.join(res_dir,
+                                        'out_block{0}{1}.png'.format(block_id, suffix)))
+
+    # Saving info as TXT
+    with span('write_log', block=block_id):
+        create_folder(os.path.join(res_dir, "block_logs"), force=False, raise_except_if_exists=False)
+        with open(os.path.join(res_dir,
+                               "block_logs",
+                               "block_{}.txt".format(block_id)),
+                  "w") as f:
+            f.write(str(block_result['scale']))
+            f.write("\n{0:.2f}".format(block_result['fmap_save_perc']))
+
+
+def get_images_inblock_matrices(image_paths, model, block_ids, scale_search_net,
+                                engine='Activations',
+                                acts_grads_engine=None,
+                                pyramid_cache=None,
+                                stats_cache=None,
+                                images=None,
+                                max_memory_mb=512,
+                                stats=DEFAULT_STATS,
+                                precision='fp32',
+                                channels_last=False,
+                                features_path=None):
+    """
+    Returns scale_net and, for every image, one inblock_matrix per block of
+    block_ids. The 'Batched' engine shares size buckets among all the images.
+    If pyramid_cache (see pyramid_utils.PyramidCache) is given, every image
+    is decoded & resized through it. If stats_cache (see
+    cache_utils.ActivationStatsCache) is given, only the scales missing
+    there are run through the CNN (it has to be built with the same stats).
+    images ({image path: decoded PIL image}) keeps the decoded images
+    between calls over sub-nets of one scale net (e.g. a scale search).
+    """
+
+    block_ids = get_block_ids(block_ids)
+    scale_net = list(scale_search_net.keys())
+    check_engine(model, engine, stats, precision, channels_last)
+    images = dict() if images is None else images
+
+    def compute(paths, net):
+        imgs, pyramids = None, None
+        if pyramid_cache is not None:
+            # Levels are looked up, only the missing ones are built (see PyramidCache.get).
+            pyramids = [pyramid_cache.get(image_path, net) for image_path in paths]
+        else:
+            missing = [image_path for image_path in paths if image_path not in images]
+            if missing:
+                with span('read_image', images=len(missing)):
+                    for image_path in missing:
+                        images[image_path] = Image.open(image_path)
+                        images[image_path].load()
+            imgs = [images[image_path] for image_path in paths]
+
+        if engine == 'Batched':
+            return get_scale_search_inblock_matrices_batched(imgs, model, block_ids, net,
+                                                             pyramids=pyramids,
+                                                             precision=precision,
+                                                             channels_last=channels_last)[1]
+        images_inblock_matrices = []
+        for i in range(len(paths)):
+            images_inblock_matrices.append(get_inblock_matrices(None if imgs is None else imgs[i],
+                                                                model, block_ids, net,
+                                                                engine=engine,
+                                                                acts_grads_engine=acts_grads_engine,
+                                                                pyramid=None if pyramids is None else pyramids[i],
+                                                                max_memory_mb=max_memory_mb,
+                                                                stats=stats,
+                                                                precision=precision,
+                                                                channels_last=channels_last,
+                                                                features_path=features_path)[1])
+        return images_inblock_matrices
+
+    if stats_cache is None:
+        return scale_net, compute(image_paths, scale_search_net)
+
+    # Group images by the scales missing in the cache, so every group is a single sweep.
+    cached = [[stats_cache.load(image_path, block_id) for block_id in block_ids] for image_path in image_paths]
+    groups = OrderedDict()
+    for i, image_cached in enumerate(cached):
+        missing = tuple(scale for scale, size in scale_search_net.items()
+                        if any(size not in block_cached for block_cached in image_cached))
+        groups.setdefault(missing, []).append(i)
+
+    for missing, ids in groups.items():
+        if not missing:
+            continue
+        net = OrderedDict((scale, scale_search_net[scale]) for scale in missing)
+        images_inblock_matrices = compute([image_paths[i] for i in ids], net)
+        for i, inblock_matrices in zip(ids, images_inblock_matrices):
+            for k, (block_id, inblock_matrix) in enumerate(zip(block_ids, inblock_matrices)):
+                entries = dict(zip(net.values(), inblock_matrix))
+                stats_cache.save(image_paths[i], block_id, entries)
+                cached[i][k].update(entries)
+
+    return scale_net, [[np.stack([block_cached[size] for size in scale_search_net.values()])
+                        for block_cached in image_cached]
+                       for image_cached in cached]
+
+
+def get_image_inblock_matrices(image_path, model, block_ids, scale_search_net,
+                               search='full',
+                               coarse_step=4,
+                               patience=3,
+                               stats=DEFAULT_STATS,
+                               **kwargs):
+    """
+    Per-image get_images_inblock_matrices (same kwargs). With
+    search='adaptive' only a coarse-to-fine subset of scale_search_net is
+    evaluated (see search_utils.get_adaptive_inblock_matrices), with
+    search='early_exit' the scales are evaluated cheap-to-expensive until
+    the decisions settle (see search_utils.get_early_exit_inblock_matrices).
+    Returns the evaluated scale_net, one inblock_matrix per block and the
+    number of saved forward passes.
+    """
+
+    stats = tuple(stats)
+    # Decoded once, every evaluated sub-net resizes the same image (or pyramid levels).
+    images = dict()
+
+    def evaluate(net):
+        # Every statistic is searched on its own, as if it was a block.
+        inblock_matrices = get_images_inblock_matrices([image_path], model, block_ids, net,
+                                                       stats=stats, images=images, **kwargs)[1][0]
+        return [stat_inblock_matrix
+                for inblock_matrix in inblock_matrices
+                for stat_inblock_matrix in split_stats_inblock_matrix(inblock_matrix, stats)]
+
+    if search == 'adaptive':
+        scale_net, inblock_matrices, saved_num = get_adaptive_inblock_matrices(evaluate, scale_search_net,
+                                                                               coarse_step=coarse_step)
+    elif search == 'early_exit':
+        scale_net, inblock_matrices, saved_num = get_early_exit_inblock_matrices(evaluate, scale_search_net,
+                                                                                 patience=patience)
+    else:
+        scale_net, inblock_matrices, saved_num = list(scale_search_net.keys()), evaluate(scale_search_net), 0
+
+    stats_num = len(stats)
+    return (scale_net,
+            [np.concatenate(inblock_matrices[k:k + stats_num], axis=1)
+             for k in range(0, len(inblock_matrices), stats_num)],
+            saved_num)
+
+
+def estimate_images_scales(image_paths, model, block_ids, scale_search_net,
+                           base_res_dir="./results",
+                           plots=True,
+                           renderer=None,
+                           store=None,
+                           search='full',
+                           coarse_step=4,
+                           patience=3,
+                           stats=DEFAULT_STATS,
+                           **kwargs):
+    """
+    Full pipeline for a group of images: analyzes all block_ids within
+    a single sweep and saves the results into <base_res_dir>/<image name>
+    (see get_images_inblock_matrices for kwargs, get_image_inblock_matrices
+    for search). With renderer (see image_utils.PlotRenderer), plots are
+    rendered in the background. With store (see store_utils.ResultsStore),
+    every block result, its curve and the per-image time are added to it. The first statistic of stats is the primary one, the
+    results of the others are saved into <base_res_dir>/<image name>/<stat>.
+    Returns a list of {block_id: {'scale': ..., 'fmap_perc': ..., 'scales_evaluated': ...}},
+    with several stats a block also holds 'stats': {stat: {...}}.
+    """
+
+    block_ids = get_block_ids(block_ids)
+    stats = tuple(stats)
+    start = time.time()
+    if search != 'full':
+        images_results = [get_image_inblock_matrices(image_path, model, block_ids, scale_search_net,
+                                                     search=search,
+                                                     coarse_step=coarse_step,
+                                                     patience=patience,
+                                                     stats=stats,
+                                                     **kwargs)[:2]
+                          for image_path in image_paths]
+    else:
+        scale_net, images_inblock_matrices = get_images_inblock_matrices(image_paths, model, block_ids,
+                                                                         scale_search_net, stats=stats, **kwargs)
+        images_results = [(scale_net, inblock_matrices) for inblock_matrices in images_inblock_matrices]
+
+    summaries = []
+    for image_path, (scale_net, inblock_matrices) in zip(image_paths, images_results):
+        res_dir = get_res_dir(image_path, base_res_dir)
+        summary = dict()
+        for block_id, inblock_matrix in zip(block_ids, inblock_matrices):
+            stats_summary = dict()
+            for stat, stat_inblock_matrix in zip(stats, split_stats_inblock_matrix(inblock_matrix, stats)):
+                block_result = get_block_result(scale_net, stat_inblock_matrix)
+                save_block_result(res_dir if stat == stats[0] else os.path.join(res_dir, stat),
+                                  block_id, scale_net, block_result, plots=plots, renderer=renderer)
+                stats_summary[stat] = {'scale': block_result['scale'],
+                                       'fmap_perc': float("{0:.2f}".format(block_result['fmap_save_perc'])),
+                                       'scales_evaluated': len(scale_net)}
+                if store is not None:
+                    store.add_block(get_image_name(image_path), block_id, stat=stat, scale_net=scale_net,
+                                    curve=block_result['filtered_merged_inblock_matrix'],
+                                    **stats_summary[stat])
+            summary[block_id] = dict(stats_summary[stats[0]])
+            if len(stats) > 1:
+                summary[block_id]['stats'] = stats_summary
+        summaries.append(summary)
+
+    if store is not None:
+        # Images of a group share the sweep, so they share its time.
+        seconds = (time.time() - start) / len(image_paths)
+        for image_path in image_paths:
+            store.add_image(get_image_name(image_path), path=image_path, stat=stats[0], seconds=seconds)
+    return summaries
+
+
+def estimate_image_scales(image_path, model, block_ids, scale_search_net, **kwargs):
+    """
+    Full per-image pipeline (see estimate_images_scales).
+    Returns {block_id: {'scale': ..., 'fmap_perc': ..., 'scales_evaluated': ...}}.
+    """
+
+    return estimate_images_scales([image_path], model, block_ids, scale_search_net, **kwargs)[0]
+
+
+def get_precision_drift(image_path, model, block_ids, scale_search_net,
+                        precision='bf16',
+                        channels_last=False,
+                        stats=DEFAULT_STATS,
+                        **kwargs):
+    """
+    Runs the full scale sweep of an image twice, with the given precision /
+    memory format and with the fp32 baseline (both bypass the stats cache),
+    and reports how far the primary statistic and the decisions drift.
+    kwargs are the ones of get_images_inblock_matrices.
+    Returns {block_id: {'scale': ..., 'scale_fp32': ..., 'fmap_perc': ..., 'fmap_perc_fp32': ...,
+                        'max_abs_err': ..., 'max_rel_err': ...}}.
+    """
+
+    block_ids = get_block_ids(block_ids)
+    kwargs = dict(kwargs, stats_cache=None, acts_grads_engine=None, stats=stats)
+    scale_net, [inblock_matrices] = get_images_inblock_matrices([image_path], model, block_ids, scale_search_net,
+                                                                precision=precision, channels_last=channels_last,
+                                                                **kwargs)
+    # Memory format conversions are in-place, so the baseline converts the model back to NCHW.
+    if model is not None:
+        model.to(memory_format=torch.contiguous_format)
+    _, [ref_inblock_matrices] = get_images_inblock_matrices([image_path], model, block_ids, scale_search_net,
+                                                            **kwargs)
+    if model is not None:
+        model.to(memory_format=torch.channels_last if channels_last else torch.contiguous_format)
+
+    drift = dict()
+    for block_id, inblock_matrix, ref_inblock_matrix in zip(block_ids, inblock_matrices, ref_inblock_matrices):
+        inblock_matrix = split_stats_inblock_matrix(inblock_matrix, stats)[0]
+        ref_inblock_matrix = split_stats_inblock_matrix(ref_inblock_matrix, stats)[0]
+        block_result = get_block_result(scale_net, inblock_matrix)
+        ref_block_result = get_block_result(scale_net, ref_inblock_matrix)
+
+        abs_err = np.abs(inblock_matrix - ref_inblock_matrix)
+        drift[block_id] = {'scale': block_result['scale'],
+                           'scale_fp32': ref_block_result['scale'],
+                           'fmap_perc': float("{0:.2f}".format(block_result['fmap_save_perc'])),
+                           'fmap_perc_fp32': float("{0:.2f}".format(ref_block_result['fmap_save_perc'])),
+                           'max_abs_err': float(abs_err.max()),
+                           'max_rel_err': float(abs_err.max() / max(np.abs(ref_inblock_matrix).max(), 1e-12))}
+    return drift
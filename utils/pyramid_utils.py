@@ -0,0 +1,138 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+import hashlib
+from collections import OrderedDict
+
+import torch
+from PIL import Image
+from torchvision.transforms import functional as TF
+
+from utils.trace_utils import span
+
+
+MEAN = [0.485, 0.456, 0.406]
+STD = [0.229, 0.224, 0.225]
+
+
+def get_uint8_tensor(img):
+    return TF.pil_to_tensor(img.convert('RGB'))
+
+
+def get_normalized_tensor(img_t):
+    """
+    Normalizes a [3, H, W] uint8 tensor as ToTensor() & Normalize() do.
+    """
+
+    return TF.normalize(img_t.float().div(255), mean=MEAN, std=STD)
+
+
+def get_level_sources(sizes, short_side=None, cascade=False):
+    """
+    Returns OrderedDict: size -> size of the level it is resized from (None
+    is the full-resolution image), largest size first. With cascade=True, a
+    level down-scaled from short_side is resized from the nearest larger
+    level of sizes.
+    """
+
+    sources = OrderedDict()
+    for size in sorted(set(sizes), reverse=True):
+        sources[size] = None
+        # Only down-scaled levels carry no interpolation artefacts of up-sampling.
+        if cascade and (size < short_side):
+            larger = [src for src in sources.keys() if size < src <= short_side]
+            if larger:
+                sources[size] = min(larger)
+    return sources
+
+
+def get_level_shape(shape, size):
+    """
+    [h, w] of a [..., H, W] image resized to the shorter side size (as transforms.Resize does).
+    """
+
+    h, w = shape[-2:]
+    return [size, int(size * w / h)] if h <= w else [int(size * h / w), size]
+
+
+class PyramidCache:
+    """
+    LRU cache of uint8 image pyramid levels. Levels are keyed by the image
+    (file path, mtime, file size) and their own size (and source level with
+    cascade), so scale nets and their sub-nets share them; get() normalizes
+    the levels of a net on the fly. With cache_dir, every level is persisted
+    as a uint8 .pt file (a quarter of a float level, read back without any
+    decoding), so that repeated runs (other blocks, other filtering rules)
+    reuse them. With cascade=True, a down-scaled level is resized from the
+    nearest larger level instead of the full-resolution image.
+    """
+
+    def __init__(self, max_items=4, cache_dir=None, cascade=False):
+        self.max_items = max_items
+        self.cache_dir = cache_dir
+        self.cascade = cascade
+        self.images = OrderedDict()
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get_key(self, image_path):
+        image_stat = os.stat(image_path)
+        return os.path.abspath(image_path), image_stat.st_mtime_ns, image_stat.st_size
+
+    def get_level_path(self, key, size, src):
+        return os.path.join(self.cache_dir, hashlib.sha1(repr(key).encode('utf-8')).hexdigest(),
+                            "{0}{1}.pt".format(size, '' if src is None else '_from{}'.format(src)))
+
+    def get_levels(self, image_path, sizes):
+        """
+        Returns {size: [3, h, w] uint8 tensor} of every size of sizes.
+        """
+
+        key = self.get_key(image_path)
+        if key not in self.images:
+            self.images[key] = {'img_t': None, 'levels': dict()}
+        self.images.move_to_end(key)
+        while len(self.images) > self.max_items:
+            self.images.popitem(last=False)
+        entry = self.images[key]
+
+        def get_img_t():
+            if entry['img_t'] is None:
+                entry['img_t'] = get_uint8_tensor(Image.open(image_path))
+            return entry['img_t']
+
+        # Without cascade, sources do not depend on the image, so persisted levels need no decoding.
+        sources = get_level_sources(sizes, min(get_img_t().shape[-2:]) if self.cascade else None, self.cascade)
+
+        levels = entry['levels']
+        missing = [(size, src) for size, src in sources.items() if (size, src) not in levels]
+        for size, src in missing:
+            level_path = None if self.cache_dir is None else self.get_level_path(key, size, src)
+            if (level_path is not None) and os.path.exists(level_path):
+                levels[(size, src)] = torch.load(level_path)
+                continue
+            with span('build_pyramid', size=size):
+                src_t = get_img_t() if src is None else levels[(src, sources[src])]
+                levels[(size, src)] = TF.resize(src_t, get_level_shape(get_img_t().shape, size), antialias=True)
+            if level_path is not None:
+                os.makedirs(os.path.dirname(level_path), exist_ok=True)
+                # Write-then-rename, so a crash or a concurrent worker never leaves a partial file.
+                tmp_path = "{0}.{1}.tmp.pt".format(level_path[:-len('.pt')], os.getpid())
+                torch.save(levels[(size, src)], tmp_path)
+                os.replace(tmp_path, level_path)
+
+        return {size: levels[(size, src)] for size, src in sources.items()}
+
+    def get(self, image_path, scale_search_net):
+        """
+        Decodes the image once and resizes it (shorter side, as transforms.Resize
+        does, antialiased) to every size of scale_search_net.
+
+        Returns OrderedDict: scale -> normalized [3, H, W] float tensor (in scale_search_net order).
+        """
+
+        levels = self.get_levels(image_path, scale_search_net.values())
+        return OrderedDict((scale, get_normalized_tensor(levels[size])) for scale, size in scale_search_net.items())
@@ -0,0 +1,165 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import numpy as np
+from collections import OrderedDict
+
+from utils.base_utils import get_filtered_inblock_matrix
+from utils.base_utils import get_block_scale
+
+
+def get_coarse_scale_ids(scales_num, coarse_step=4):
+    """
+    Every coarse_step-th scale plus both edges, which the decision needs.
+    """
+
+    return sorted(set(range(0, scales_num, coarse_step)) | {scales_num - 1})
+
+
+def get_refine_scale_ids(evaluated_ids, inblock_matrix, scales_num):
+    """
+    Not yet evaluated scales between the neighbours of the interior
+    extrema of the filtered merged curve (built upon evaluated_ids only).
+    """
+
+    _, filtered_inblock_matrix = get_filtered_inblock_matrix(inblock_matrix)
+    if filtered_inblock_matrix.shape[1] == 0:
+        return set()
+    filtered_merged_inblock_matrix = np.mean(filtered_inblock_matrix, axis=1)
+
+    refine_ids = set()
+    for p in {int(np.argmax(filtered_merged_inblock_matrix)), int(np.argmin(filtered_merged_inblock_matrix))}:
+        if 0 < p < len(evaluated_ids) - 1:
+            refine_ids |= set(range(evaluated_ids[p - 1] + 1, evaluated_ids[p + 1]))
+    return refine_ids - set(evaluated_ids)
+
+
+def get_adaptive_inblock_matrices(evaluate, scale_search_net, coarse_step=4):
+    """
+    Coarse-to-fine scale search. evaluate(net) must return one
+    inblock_matrix per block for a sub-net of scale_search_net.
+
+    First the coarse subset is probed, then the grid is refined around the
+    interior extrema (of any block) until their neighbours on the full grid
+    are evaluated. Returns the evaluated scale_net, one inblock_matrix per
+    block over it, and the number of saved forward passes.
+    """
+
+    scale_net = list(scale_search_net.keys())
+    scales_num = len(scale_net)
+
+    evaluated = dict()
+    todo = get_coarse_scale_ids(scales_num, coarse_step)
+    while todo:
+        net = OrderedDict((scale_net[i], scale_search_net[scale_net[i]]) for i in todo)
+        inblock_matrices = evaluate(net)
+        for j, i in enumerate(todo):
+            evaluated[i] = [inblock_matrix[j] for inblock_matrix in inblock_matrices]
+
+        evaluated_ids = sorted(evaluated.keys())
+        refine_ids = set()
+        for k in range(len(inblock_matrices)):
+            inblock_matrix = np.stack([evaluated[i][k] for i in evaluated_ids])
+            refine_ids |= get_refine_scale_ids(evaluated_ids, inblock_matrix, scales_num)
+        todo = sorted(refine_ids)
+
+    evaluated_ids = sorted(evaluated.keys())
+    blocks_num = len(evaluated[evaluated_ids[0]])
+    return ([scale_net[i] for i in evaluated_ids],
+            [np.stack([evaluated[i][k] for i in evaluated_ids]) for k in range(blocks_num)],
+            scales_num - len(evaluated_ids))
+
+
+class IncrementalBlockEvaluator:
+    """
+    Feeds a block's pooled vectors scale by scale (in ascending scale order,
+    which is also cheap-to-expensive) and keeps per-channel running
+    max / min with their first positions, so the filtering procedure of
+    base_utils.get_fmap_save_mask holds for the evaluated prefix at O(C)
+    per scale. The merged curve and the block decision are refreshed after
+    every scale; the block is stable, once it is decided and, for patience
+    consecutive scales, the decision did not change and at most fmap_tol
+    of the channels (but one at least) entered or left the filtered set.
+    It is a heuristic: unseen scales are not bounded, so a later, larger
+    extremum can not be ruled out.
+    """
+
+    def __init__(self, scale_net, patience=3, fmap_tol=0.02):
+        self.scale_net = scale_net
+        self.patience = patience
+        self.fmap_tol = fmap_tol
+        self.rows = []
+        self.v_max, self.i_max, self.v_min, self.i_min = None, None, None, None
+        self.fmap_save_mask = None
+        self.scale = None
+        self.unchanged_num = 0
+
+    def update(self, blob):
+        blob = np.asarray(blob)
+        t = len(self.rows)
+        self.rows.append(blob)
+
+        if t == 0:
+            self.v_max, self.v_min = blob.copy(), blob.copy()
+            self.i_max, self.i_min = np.zeros(blob.shape, dtype=np.int64), np.zeros(blob.shape, dtype=np.int64)
+        else:
+            # Strict comparisons keep the first occurrence, as np.argmax / np.argmin do.
+            is_max, is_min = blob > self.v_max, blob < self.v_min
+            self.v_max[is_max], self.i_max[is_max] = blob[is_max], t
+            self.v_min[is_min], self.i_min[is_min] = blob[is_min], t
+
+        is_const = np.isclose(self.v_max, self.v_min)
+        is_monotonic = ((self.i_max == 0) | (self.i_max == t)) & ((self.i_min == 0) | (self.i_min == t))
+        fmap_save_mask = ~is_const & ~is_monotonic
+
+        scale = None
+        if fmap_save_mask.any():
+            filtered_merged_inblock_matrix = np.mean(np.stack(self.rows)[:, fmap_save_mask], axis=1)
+            scale = get_block_scale(self.scale_net[:t + 1], filtered_merged_inblock_matrix)
+
+        # An undecided (None) block has not met its interior extremum yet, so it never settles.
+        if (scale is not None) and (scale == self.scale) and \
+                (np.sum(fmap_save_mask != self.fmap_save_mask) <= max(1., self.fmap_tol * len(fmap_save_mask))):
+            self.unchanged_num += 1
+        else:
+            self.unchanged_num = 0
+        self.fmap_save_mask, self.scale = fmap_save_mask, scale
+
+    def is_stable(self):
+        return self.unchanged_num >= self.patience
+
+    def get_inblock_matrix(self):
+        return np.stack(self.rows)
+
+
+def get_early_exit_inblock_matrices(evaluate, scale_search_net, patience=3, fmap_tol=0.02):
+    """
+    Incremental scale search with early exit. evaluate(net) must return one
+    inblock_matrix per block for a sub-net of scale_search_net.
+
+    Scales are run one by one in ascending order (growing input size), and
+    the search stops once every block is stable (see
+    IncrementalBlockEvaluator), skipping the remaining, most expensive, ones.
+    Returns the evaluated scale_net, one inblock_matrix per block over it,
+    and the number of saved forward passes.
+    """
+
+    scale_net = list(scale_search_net.keys())
+    assert scale_net == sorted(scale_net)
+
+    evaluators = None
+    for t, scale in enumerate(scale_net):
+        inblock_matrices = evaluate(OrderedDict([(scale, scale_search_net[scale])]))
+        if evaluators is None:
+            evaluators = [IncrementalBlockEvaluator(scale_net, patience, fmap_tol) for _ in inblock_matrices]
+        for evaluator, inblock_matrix in zip(evaluators, inblock_matrices):
+            evaluator.update(inblock_matrix[0])
+        if all(evaluator.is_stable() for evaluator in evaluators):
+            break
+
+    evaluated_num = len(evaluators[0].rows)
+    return (scale_net[:evaluated_num],
+            [evaluator.get_inblock_matrix() for evaluator in evaluators],
+            len(scale_net) - evaluated_num)
@@ -0,0 +1,47 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import math
+import numpy as np
+
+import torch
+
+
+DEFAULT_STATS = ('mean',)
+TOPK_RATIO = 0.05
+
+
+def get_topk_mean(relu_t, topk_ratio=TOPK_RATIO):
+    k = max(1, int(math.ceil(topk_ratio * relu_t.shape[-1])))
+    return torch.topk(relu_t, k, dim=-1, sorted=False).values.mean(dim=-1)
+
+
+# Per-channel statistics of ReLU(activation), relu_t is [B, C, H * W].
+STATS = {
+    'mean': lambda relu_t: relu_t.mean(dim=-1),
+    'max': lambda relu_t: relu_t.amax(dim=-1),
+    'l2': lambda relu_t: relu_t.square().mean(dim=-1),
+    'sparsity': lambda relu_t: (relu_t == 0).float().mean(dim=-1),
+    'topk': get_topk_mean
+}
+
+
+def get_channel_stats(activation, stats=DEFAULT_STATS):
+    """
+    Computes every statistic of stats (see STATS) for a [B, C, H, W]
+    activation within a single ReLU pass and returns them concatenated
+    along channels: [B, len(stats) * C] (in stats order).
+    """
+
+    relu_t = torch.relu(activation).flatten(start_dim=2)
+    return torch.cat([STATS[stat](relu_t) for stat in stats], dim=1)
+
+
+def split_stats_inblock_matrix(inblock_matrix, stats=DEFAULT_STATS):
+    """
+    [scales, len(stats) * C] -> one [scales, C] inblock_matrix per statistic.
+    """
+
+    return np.split(inblock_matrix, len(stats), axis=1)
@@ -0,0 +1,180 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+import time
+import sqlite3
+import numpy as np
+
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS images (
+           image TEXT PRIMARY KEY,
+           path TEXT,
+           stat TEXT,
+           seconds REAL,
+           created REAL
+       )""",
+    """CREATE TABLE IF NOT EXISTS blocks (
+           image TEXT NOT NULL,
+           block INTEGER NOT NULL,
+           stat TEXT NOT NULL,
+           scale REAL,
+           fmap_perc REAL,
+           scales_evaluated INTEGER,
+           scale_net BLOB,
+           curve BLOB,
+           PRIMARY KEY (image, block, stat)
+       ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS blocks_block_stat ON blocks (block, stat)"
+]
+
+
+def to_blob(values):
+    return None if values is None else np.asarray(values, dtype=np.float32).tobytes()
+
+
+def from_blob(blob):
+    return None if blob is None else np.frombuffer(blob, dtype=np.float32)
+
+
+class ResultsStore:
+    """
+    SQLite (WAL) store of the pipeline results: per image (path, primary
+    statistic, seconds) and per image / block / statistic (scale, fmap %,
+    number of evaluated scales, evaluated scale_net and the filtered merged
+    curve over it, as float32 blobs). Blocks are keyed by image, so lookups
+    by image are indexed and dataset-wide aggregations are single queries.
+
+    Writes are buffered and committed batch_size rows at a time (or on
+    flush() / close()) within one transaction. WAL lets readers run along
+    with a writer, and several processes may write the same file: a
+    blocked writer waits up to timeout seconds. Re-added rows replace the
+    old ones. A store may be used from any thread, one at a time.
+    """
+
+    def __init__(self, path, batch_size=256, timeout=60.):
+        self.path = path
+        self.batch_size = batch_size
+        if os.path.dirname(os.path.abspath(path)):
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+
+        self.image_rows = []
+        self.block_rows = []
+
+    def add_image(self, image_name, path=None, stat='mean', seconds=None):
+        self.image_rows.append((image_name, path, stat, seconds, time.time()))
+        self.flush_if_full()
+
+    def add_block(self, image_name, block_id, scale, fmap_perc,
+                  scales_evaluated=None,
+                  stat='mean',
+                  scale_net=None,
+                  curve=None):
+        self.block_rows.append((image_name, int(block_id), stat,
+                                None if scale is None else float(scale),
+                                float(fmap_perc),
+                                scales_evaluated,
+                                to_blob(scale_net),
+                                to_blob(curve)))
+        self.flush_if_full()
+
+    def flush_if_full(self):
+        if len(self.image_rows) + len(self.block_rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not (self.image_rows or self.block_rows):
+            return
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO images VALUES (?, ?, ?, ?, ?)", self.image_rows)
+            self.connection.executemany("INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                        self.block_rows)
+        self.image_rows, self.block_rows = [], []
+
+    def query(self, sql, params=()):
+        self.flush()
+        return self.connection.execute(sql, params).fetchall()
+
+    def get_images(self):
+        return set(image_name for image_name, in self.query("SELECT image FROM images"))
+
+    def get_image_stat(self, image_name):
+        rows = self.query("SELECT stat FROM images WHERE image = ?", (image_name,))
+        if not rows:
+            raise KeyError("{0} holds no results of {1}".format(self.path, image_name))
+        return rows[0][0]
+
+    def get_block_logs(self, image_name, stat=None):
+        """
+        Returns {block_id: (scale, fm_perc)} (see tree_utils.read_block_logs)
+        of the image's primary statistic, unless stat is given.
+        """
+
+        stat = self.get_image_stat(image_name) if stat is None else stat
+        return {block_id: (scale, fmap_perc)
+                for block_id, scale, fmap_perc in self.query("SELECT block, scale, fmap_perc FROM blocks "
+                                                             "WHERE image = ? AND stat = ? ORDER BY block",
+                                                             (image_name, stat))}
+
+    def get_curves(self, image_name, stat=None):
+        """
+        Returns {block_id: (scale_net, filtered merged curve)} of the image.
+        """
+
+        stat = self.get_image_stat(image_name) if stat is None else stat
+        return {block_id: (from_blob(scale_net), from_blob(curve))
+                for block_id, scale_net, curve in self.query("SELECT block, scale_net, curve FROM blocks "
+                                                             "WHERE image = ? AND stat = ? ORDER BY block",
+                                                             (image_name, stat))}
+
+    def get_block_rows(self, stat=None):
+        """
+        Returns (image, block_id, scale, fm_perc) rows of every stored image
+        (see tree_utils.get_block_arrays) of its primary statistic (as
+        get_block_logs does), unless stat is given.
+        """
+
+        if stat is None:
+            return self.query("SELECT blocks.image, blocks.block, blocks.scale, blocks.fmap_perc FROM blocks "
+                              "JOIN images ON images.image = blocks.image AND images.stat = blocks.stat")
+        return self.query("SELECT image, block, scale, fmap_perc FROM blocks WHERE stat = ?", (stat,))
+
+    def get_tree_scales(self, stat='mean'):
+        """
+        Returns {image: mean scale over its decided blocks} (see
+        tree_utils.get_tree_solution) for every stored image.
+        """
+
+        return dict(self.query("SELECT image, AVG(scale) FROM blocks WHERE stat = ? GROUP BY image", (stat,)))
+
+    def get_blocks_summary(self, stat='mean'):
+        """
+        Returns {block_id: {'images', 'decided', 'scale', 'fmap_perc'}}: the
+        number of images, of decided ones, mean scale (over decided images)
+        and mean fmap % of every block.
+        """
+
+        return {block_id: {'images': images, 'decided': decided, 'scale': scale, 'fmap_perc': fmap_perc}
+                for block_id, images, decided, scale, fmap_perc in self.query(
+                    "SELECT block, COUNT(*), COUNT(scale), AVG(scale), AVG(fmap_perc) FROM blocks "
+                    "WHERE stat = ? GROUP BY block ORDER BY block", (stat,))}
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
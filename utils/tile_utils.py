@@ -0,0 +1,175 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import math
+import numpy as np
+from tqdm import tqdm
+
+import torch
+import torch.nn as nn
+
+from pytorch_grad_cam.utils.precision import get_autocast
+from pytorch_grad_cam.utils.precision import to_memory_format
+
+from utils.base_utils import get_block_ids
+from utils.base_utils import get_scale_transform
+from utils.pyramid_utils import get_level_shape
+from utils.trace_utils import span
+from utils.trace_utils import count
+
+
+def get_stages_geometry(stages):
+    """
+    Returns the stride (down-sampling factor) of every stage output and the
+    receptive-field radius (in input pixels) of the last stage output.
+    """
+
+    strides = []
+    radius, stride = 0, 1
+    for stage in stages:
+        for layer in stage:
+            if isinstance(layer, nn.Conv2d):
+                assert layer.stride == (1, 1)
+                radius += (max(layer.kernel_size) - 1) // 2 * stride
+            elif isinstance(layer, nn.MaxPool2d):
+                assert layer.padding == 0 and layer.dilation == 1 and not layer.ceil_mode
+                radius += (layer.kernel_size - 1) * stride
+                stride *= layer.stride
+        strides.append(stride)
+    return strides, radius
+
+
+def estimate_peak_bytes(stages, h, w, bytes_per_value=4):
+    """
+    Peak of (input + output) activation bytes over all layers for a single
+    [1, 3, h, w] input (the forward holds one layer's input and output).
+    """
+
+    peak = 0
+    c = 3
+    for stage in stages:
+        for layer in stage:
+            c_out, h_out, w_out = c, h, w
+            if isinstance(layer, nn.Conv2d):
+                c_out = layer.out_channels
+            elif isinstance(layer, nn.MaxPool2d):
+                h_out, w_out = (h - layer.kernel_size) // layer.stride + 1, (w - layer.kernel_size) // layer.stride + 1
+            peak = max(peak, (c * h * w + c_out * h_out * w_out) * bytes_per_value)
+            c, h, w = c_out, h_out, w_out
+    return peak
+
+
+def get_tile_size(stages, h, w, max_bytes):
+    """
+    Largest core tile size (a multiple of the deepest stride), whose haloed
+    tile fits into max_bytes. Returns (tile_size, halo).
+    Raises ValueError, if even a single deepest-stride tile does not fit.
+    """
+
+    strides, radius = get_stages_geometry(stages)
+    step = strides[-1]
+    # Halo is aligned to the deepest stride, so pooling windows stay aligned.
+    halo = int(math.ceil(radius / step)) * step
+
+    tile_size = int(math.ceil(max(h, w) / step)) * step
+    while (tile_size > step) and \
+            (estimate_peak_bytes(stages, min(h, tile_size + 2 * halo), min(w, tile_size + 2 * halo)) > max_bytes):
+        tile_size -= step
+
+    peak_bytes = estimate_peak_bytes(stages, min(h, tile_size + 2 * halo), min(w, tile_size + 2 * halo))
+    if peak_bytes > max_bytes:
+        # Halos are not shrinkable, a smaller limit would only recompute overlapping tiles for nothing.
+        raise ValueError("a {0}x{1} input needs {2:.0f} MB at least (a {3} px tile with a {4} px halo), "
+                         "got a limit of {5:.0f} MB".format(h, w, math.ceil(peak_bytes / 2 ** 20), tile_size, halo,
+                                                            max_bytes / 2 ** 20))
+    return tile_size, halo
+
+
+def get_tiled_stages_stats(stages, img_t, max_bytes, channels_last=False):
+    """
+    Exact AvgPool[ReLU(...)] of every stage output for a single [3, H, W]
+    image, evaluated tile by tile so that the peak activation memory stays
+    within max_bytes (see get_tile_size).
+
+    Tiles are aligned to the deepest stride and extended by a halo of the
+    receptive-field radius, clipped at the image border (where zero padding
+    is the true one). Only the core of every tile is accumulated, so the
+    cores partition every stage output and no value is counted twice.
+    """
+
+    strides, _ = get_stages_geometry(stages)
+    h, w = img_t.shape[-2:]
+    tile_size, halo = get_tile_size(stages, h, w, max_bytes)
+
+    sums = [None] * len(stages)
+    for y0 in range(0, h, tile_size):
+        for x0 in range(0, w, tile_size):
+            y1, x1 = min(y0 + tile_size, h), min(x0 + tile_size, w)
+            ty0, tx0 = max(0, y0 - halo), max(0, x0 - halo)
+            ty1, tx1 = min(h, y1 + halo), min(w, x1 + halo)
+
+            # Tile starts are multiples of every stride, so the tile maps floor as the whole ones do.
+            x = to_memory_format(img_t[None, :, ty0:ty1, tx0:tx1], channels_last)
+            for k, stage in enumerate(stages):
+                for layer in stage:
+                    x = layer(x)
+                s = strides[k]
+                core = x[:, :,
+                         (y0 - ty0) // s:(y1 - ty0) // s,
+                         (x0 - tx0) // s:(x1 - tx0) // s]
+                core_sum = torch.relu(core.float()).sum(dim=(0, 2, 3))
+                sums[k] = core_sum if sums[k] is None else sums[k] + core_sum
+
+    return [stage_sum / ((h // s) * (w // s)) for stage_sum, s in zip(sums, strides)]
+
+
+def get_scale_search_inblock_matrix_tiled(img,
+                                          model,
+                                          block_ids,
+                                          scale_search_net,
+                                          max_memory_mb=512,
+                                          pyramid=None,
+                                          precision='fp32',
+                                          channels_last=False):
+    """
+    Tiled counterpart of base_utils.get_scale_search_inblock_matrix with
+    peak activation memory bounded by max_memory_mb, whatever the scale
+    (estimated for float32 activations). Raises ValueError before the
+    sweep, if the haloed tile of the deepest block can not meet the bound
+    at some scale.
+    Returns scale_net and one inblock_matrix per block of block_ids (sorted ascending).
+    """
+
+    block_ids = [int(block_id) for block_id in get_block_ids(block_ids)]
+    stages = to_memory_format(model.eval(), channels_last).get_stages(block_ids[-1])
+    max_bytes = max_memory_mb * 1024 * 1024
+
+    scale_net = list(scale_search_net.keys())
+    value_nets = [[] for _ in block_ids]
+
+    # Every scale is checked against the bound up front, not after the cheaper ones have been run.
+    for scale_curr, size_curr in scale_search_net.items():
+        if pyramid is not None:
+            h, w = pyramid[scale_curr].shape[-2:]
+        else:
+            h, w = get_level_shape((img.height, img.width), size_curr)
+        get_tile_size(stages, h, w, max_bytes)
+
+    with torch.inference_mode(), get_autocast(precision):
+        for scale_curr, size_curr in tqdm(scale_search_net.items()):
+            with span('resize', scale=scale_curr, size=size_curr):
+                if pyramid is not None:
+                    img_t = pyramid[scale_curr]
+                else:
+                    img_t = get_scale_transform(size_curr)(img)
+
+            with span('engine', scale=scale_curr, size=size_curr):
+                stages_stats = get_tiled_stages_stats(stages, img_t, max_bytes, channels_last=channels_last)
+            count('forward_passes')
+            for value_net, block_id in zip(value_nets, block_ids):
+                value_net.append(stages_stats[block_id - 1].numpy())
+                count('host_bytes', value_net[-1].nbytes)
+
+    return scale_net, [np.array(value_net) for value_net in value_nets]
@@ -0,0 +1,129 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+import json
+import time
+import threading
+from contextlib import ExitStack
+from contextlib import contextmanager
+from contextlib import nullcontext
+from collections import OrderedDict
+
+
+# The active tracer (see Tracer.start): span() and count() are no-ops without one.
+_tracer = None
+
+
+def span(name, **args):
+    """
+    Times the enclosed code as a span of the active tracer (if any):
+    with span('engine', scale=2.0): ...
+    """
+
+    return nullcontext() if _tracer is None else _tracer.span(name, **args)
+
+
+def count(name, value=1):
+    """
+    Adds value to the counter name of the active tracer (if any).
+    """
+
+    if _tracer is not None:
+        _tracer.count(name, value)
+
+
+class Tracer:
+    """
+    Collects spans (name, start, duration, thread) and aggregated counters
+    (e.g. forward passes, bytes copied to host) of the instrumented
+    pipeline, while it is the active tracer (start() / stop(), or a with
+    block). save() exports a Chrome-trace JSON (chrome://tracing, Perfetto).
+
+    With torch_profiler=True, the run is recorded by torch.profiler as well,
+    spans are marked there by record_function, and save() exports the
+    torch.profiler trace (operators, with the spans on top) instead.
+    """
+
+    def __init__(self, torch_profiler=False):
+        self.torch_profiler = torch_profiler
+        self.profiler = None
+        self.events = []
+        self.counters = OrderedDict()
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+
+    def get_us(self):
+        return (time.perf_counter() - self.origin) * 1e6
+
+    @contextmanager
+    def span(self, name, **args):
+        with ExitStack() as stack:
+            if self.profiler is not None:
+                import torch
+                stack.enter_context(torch.profiler.record_function(name))
+            start = self.get_us()
+            try:
+                yield
+            finally:
+                self.events.append({'name': name, 'cat': 'scale', 'ph': 'X',
+                                    'ts': start, 'dur': self.get_us() - start,
+                                    'pid': self.pid, 'tid': threading.get_ident(),
+                                    'args': args})
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+            self.events.append({'name': name, 'ph': 'C', 'ts': self.get_us(), 'pid': self.pid,
+                                'args': {name: self.counters[name]}})
+
+    def start(self):
+        global _tracer
+        if self.torch_profiler:
+            import torch
+            activities = [torch.profiler.ProfilerActivity.CPU]
+            if torch.cuda.is_available():
+                activities.append(torch.profiler.ProfilerActivity.CUDA)
+            self.profiler = torch.profiler.profile(activities=activities)
+            self.profiler.__enter__()
+        _tracer = self
+        return self
+
+    def stop(self):
+        global _tracer
+        if _tracer is self:
+            _tracer = None
+        if self.profiler is not None:
+            self.profiler.__exit__(None, None, None)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.stop()
+
+    def get_summary(self):
+        """
+        Returns {'spans': {name: {'count', 'seconds'}}, 'counters': {name: value}}.
+        """
+
+        spans = OrderedDict()
+        for event in self.events:
+            if event['ph'] == 'X':
+                span_summary = spans.setdefault(event['name'], {'count': 0, 'seconds': 0.})
+                span_summary['count'] += 1
+                span_summary['seconds'] += event['dur'] / 1e6
+        return {'spans': spans, 'counters': dict(self.counters)}
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if self.profiler is not None:
+            self.profiler.export_chrome_trace(path)
+            return
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.events,
+                       'displayTimeUnit': 'ms',
+                       'otherData': {'counters': self.counters}}, f)
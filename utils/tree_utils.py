@@ -0,0 +1,260 @@
+"""
+ @author   Maksim Penkin
+"""
+
+
+import os
+import csv
+import numpy as np
+
+from utils.image_utils import get_figure
+from utils.image_utils import plot_scatter
+
+
+# Bins of dataset histograms: centered on the 0.25 scale grid, and fmap % deciles.
+SCALE_BINS = np.arange(-3.125, 4.25, 0.25)
+FMAP_PERC_BINS = np.linspace(0., 100., 11)
+
+
+def get_image_name(image_path):
+    return os.path.splitext(os.path.split(image_path)[-1])[0]
+
+
+def read_block_logs(block_logs_dir):
+    """
+    Returns {block_id: (scale, fm_perc)}, scale is None for undecided blocks.
+    """
+
+    block_logs = dict()
+    for txt_name in sorted(os.listdir(block_logs_dir)):
+        name = os.path.splitext(txt_name)[0]
+        block_id = int(name.split('_')[-1])
+
+        with open(os.path.join(block_logs_dir, txt_name), 'rt') as f:
+            txt_lines = f.read().splitlines()
+        assert len(txt_lines) == 2
+
+        scale, fm_perc = txt_lines
+        if scale == 'None':
+            scale = None
+        else:
+            scale = float(scale)
+        block_logs[block_id] = (scale, float(fm_perc))
+    return block_logs
+
+
+def get_summary_block_logs(summary):
+    """
+    Converts pipeline summary {block_id: {'scale', 'fmap_perc'}} (see
+    pipeline_utils.estimate_images_scales) into read_block_logs format.
+    """
+
+    block_logs = dict()
+    for block_id, block_summary in summary.items():
+        scale = block_summary['scale']
+        block_logs[int(block_id)] = (None if scale is None else float(scale), block_summary['fmap_perc'])
+    return block_logs
+
+
+def get_tree_solution(image_name, block_logs):
+    """
+    Returns block_net, scale_net of decided blocks and the dataset_log.csv row.
+    """
+
+    block_net = []
+    scale_net = []
+    df_dict = dict()
+    df_dict['image'] = [image_name]
+
+    for block_id in sorted(block_logs.keys()):
+        scale, fm_perc = block_logs[block_id]
+        if scale is not None:
+            block_net.append(block_id)
+            scale_net.append(scale)
+
+        df_dict['b{}_s'.format(block_id)] = [scale]
+        df_dict['b{}_fm'.format(block_id)] = [fm_perc]
+    df_dict['s'] = [np.mean(scale_net)]
+
+    return block_net, scale_net, df_dict
+
+
+def read_dataset_block_logs(base_dir):
+    """
+    Reads block logs of every image of a base result directory.
+    Returns (image, block_id, scale, fm_perc) rows, see get_block_arrays.
+    """
+
+    rows = []
+    for entry in sorted(os.scandir(base_dir), key=lambda e: e.name):
+        block_logs_dir = os.path.join(entry.path, "block_logs")
+        if entry.is_dir() and os.path.isdir(block_logs_dir):
+            rows.extend((entry.name, block_id, scale, fm_perc)
+                        for block_id, (scale, fm_perc) in read_block_logs(block_logs_dir).items())
+    return rows
+
+
+def get_block_arrays(rows):
+    """
+    (image, block_id, scale, fm_perc) rows -> image_names, block_ids and
+    [images, blocks] arrays of scales and fm_percs (NaN for undecided
+    blocks and for blocks missing in an image).
+    """
+
+    image_names, image_idx = np.unique(np.array([row[0] for row in rows], dtype=object).astype(str),
+                                       return_inverse=True)
+    block_ids, block_idx = np.unique(np.array([row[1] for row in rows], dtype=np.int64), return_inverse=True)
+
+    scales = np.full((len(image_names), len(block_ids)), np.nan)
+    fm_percs = np.full((len(image_names), len(block_ids)), np.nan)
+    scales[image_idx, block_idx] = np.array([np.nan if row[2] is None else row[2] for row in rows], dtype=np.float64)
+    fm_percs[image_idx, block_idx] = np.array([row[3] for row in rows], dtype=np.float64)
+    return image_names.tolist(), block_ids.tolist(), scales, fm_percs
+
+
+def get_tree_solutions(image_names, block_ids, scales, fm_percs):
+    """
+    Vectorized get_tree_solution over a dataset (see get_block_arrays).
+    Returns tree scales (NaN where no block is decided) and the
+    dataset_log.csv columns of every image.
+    """
+
+    decided = ~np.isnan(scales)
+    decided_num = decided.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        tree_scales = np.where(decided, scales, 0.).sum(axis=1) / decided_num
+
+    df_dict = dict()
+    df_dict['image'] = image_names
+    for k, block_id in enumerate(block_ids):
+        df_dict['b{}_s'.format(block_id)] = scales[:, k]
+        df_dict['b{}_fm'.format(block_id)] = fm_percs[:, k]
+    df_dict['s'] = tree_scales
+
+    return tree_scales, df_dict
+
+
+def get_dataset_histograms(block_ids, scales, fm_percs, tree_scales,
+                           scale_bins=SCALE_BINS,
+                           fm_perc_bins=FMAP_PERC_BINS):
+    """
+    Dataset-level histograms: chosen scales and fmap % of every block (over
+    its decided / present images), and tree scales. Returns rows of
+    {'kind', 'block', 'bin_left', 'bin_right', 'count'}; undecided images of
+    a block are counted by a 'block_undecided' row.
+    """
+
+    def get_rows(kind, block_id, values, bins):
+        counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+        return [{'kind': kind, 'block': block_id, 'bin_left': left, 'bin_right': right, 'count': count}
+                for left, right, count in zip(edges[:-1], edges[1:], counts)]
+
+    rows = []
+    for k, block_id in enumerate(block_ids):
+        rows.extend(get_rows('block_scale', block_id, scales[:, k], scale_bins))
+        rows.extend(get_rows('block_fm', block_id, fm_percs[:, k], fm_perc_bins))
+        rows.append({'kind': 'block_undecided', 'block': block_id, 'bin_left': None, 'bin_right': None,
+                     'count': int(np.sum(np.isnan(scales[:, k]) & ~np.isnan(fm_percs[:, k])))})
+    rows.extend(get_rows('tree_scale', None, tree_scales, scale_bins))
+    return rows
+
+
+def save_dataset_histograms(histograms, csv_path):
+    columns = ['kind', 'block', 'bin_left', 'bin_right', 'count']
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows([['' if row[column] is None else row[column] for column in columns]
+                          for row in histograms])
+
+
+def plot_dataset_histograms(histograms, save_path):
+    fig, ax = get_figure()
+
+    for kind, label in [('block_scale', "Block #{}"), ('tree_scale', "Tree")]:
+        for block_id in sorted(set(row['block'] for row in histograms if row['kind'] == kind), key=str):
+            block_rows = [row for row in histograms if (row['kind'] == kind) and (row['block'] == block_id)]
+            ax.step([(row['bin_left'] + row['bin_right']) / 2 for row in block_rows],
+                    [row['count'] for row in block_rows],
+                    where='mid', label=label.format(block_id), linewidth=2 if kind == 'tree_scale' else 1)
+    ax.grid()
+    ax.set(xlabel="Chosen Scale",
+           ylabel="Images")
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(save_path)
+
+
+def plot_tree_solution(block_net, scale_net, save_path):
+    plot_scatter(x_values=block_net,
+                 y_values=scale_net,
+                 x_label="Block",
+                 y_label="Chosen Scale",
+                 x_lim=(0, 6),
+                 y_lim=(-6, 6),
+                 save_path=save_path)
+
+
+def append_dataset_log(csv_log, df_dict, mode='a'):
+    """
+    Appends the rows of df_dict (see get_tree_solution, get_tree_solutions)
+    to csv_log (or rewrites it, with mode='w'), as pandas.DataFrame.to_csv
+    would (None and NaN are written empty), but without importing pandas.
+    """
+
+    header = (mode == 'w') or not os.path.exists(csv_log)
+    columns = list(df_dict.keys())
+    with open(csv_log, mode, newline='') as f:
+        writer = csv.writer(f)
+        if header:
+            writer.writerow(columns)
+        for row in zip(*(df_dict[column] for column in columns)):
+            writer.writerow(['' if (value is None) or (isinstance(value, float) and np.isnan(value)) else value
+                             for value in row])
+
+
+def get_logged_images(csv_log):
+    if not os.path.exists(csv_log):
+        return set()
+    with open(csv_log, 'r', newline='') as f:
+        return set(row['image'] for row in csv.DictReader(f))
+
+
+def get_block_logs_agreement(ref_res_dir, res_dir):
+    """
+    Compares block logs of the images present in both base result
+    directories (e.g. float32 and VGG19-int8 runs).
+    Returns per-image, per-block DataFrame and per-block summary DataFrame
+    (scale agreement, mean |scale difference| over blocks decided in both,
+    mean |fmap % difference|).
+    """
+
+    import pandas as pd
+
+    rows = []
+    for image_name in sorted(os.listdir(ref_res_dir)):
+        ref_block_logs_dir = os.path.join(ref_res_dir, image_name, "block_logs")
+        block_logs_dir = os.path.join(res_dir, image_name, "block_logs")
+        if not (os.path.isdir(ref_block_logs_dir) and os.path.isdir(block_logs_dir)):
+            continue
+
+        ref_block_logs, block_logs = read_block_logs(ref_block_logs_dir), read_block_logs(block_logs_dir)
+        for block_id in sorted(set(ref_block_logs) & set(block_logs)):
+            (ref_scale, ref_fm_perc), (scale, fm_perc) = ref_block_logs[block_id], block_logs[block_id]
+            rows.append({'image': image_name,
+                         'block': block_id,
+                         'ref_s': ref_scale,
+                         's': scale,
+                         'ref_fm': ref_fm_perc,
+                         'fm': fm_perc})
+
+    df = pd.DataFrame(rows, columns=['image', 'block', 'ref_s', 's', 'ref_fm', 'fm'])
+    df['agree'] = (df['ref_s'] == df['s']) | (df['ref_s'].isna() & df['s'].isna())
+    df['s_diff'] = (df['s'] - df['ref_s']).abs()
+    df['fm_diff'] = (df['fm'] - df['ref_fm']).abs()
+
+    summary = df.groupby('block').agg(images=('image', 'count'),
+                                      agreement=('agree', 'mean'),
+                                      s_diff=('s_diff', 'mean'),
+                                      fm_diff=('fm_diff', 'mean')).reset_index()
+    return df, summary